@@ -0,0 +1,50 @@
+"""
+Festplatten-Cache für synthetisierte Audiodaten, damit deterministische Musik und
+Sound-Effekte nur beim ersten Start berechnet werden müssen.
+"""
+import hashlib
+from pathlib import Path
+from typing import Callable
+from game.constants import AUDIO_CACHE_DIRECTORY
+
+class AudioCache:
+    def __init__(self, *source_files: str):
+        """Initialisiert den Cache; der Schlüssel hängt vom Inhalt der erzeugenden Quelldateien ab."""
+        digest = hashlib.sha1()
+        for source_file in source_files:
+            digest.update(Path(source_file).read_bytes())
+        
+        # Ändert sich der Generator-Code, werden automatisch neue Cache-Dateien angelegt
+        self.version = digest.hexdigest()[:12]
+        self.directory = Path(AUDIO_CACHE_DIRECTORY)
+    
+    def _path(self, tag: str) -> Path:
+        """Liefert den Dateipfad für einen Cache-Eintrag der aktuellen Version."""
+        return self.directory / f"{tag}-{self.version}.raw"
+    
+    def __contains__(self, tag: str) -> bool:
+        """Prüft, ob für tag bereits Daten im Cache liegen."""
+        return self._path(tag).is_file()
+    
+    def get_or_create(self, tag: str, generate: Callable[[], bytes]) -> bytes:
+        """Gibt die gespeicherten PCM-Daten zurück oder erzeugt und speichert sie."""
+        path = self._path(tag)
+        
+        try:
+            return path.read_bytes()
+        except OSError:
+            pass
+        
+        data = generate()
+        
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Erst in eine temporäre Datei schreiben und dann umbenennen, damit ein
+            # abgebrochener Start keine abgeschnittene Cache-Datei hinterlässt
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_bytes(data)
+            temp_path.replace(path)
+        except OSError as e:
+            print(f"Fehler beim Schreiben des Audio-Caches: {e}")
+        
+        return data
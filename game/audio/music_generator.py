@@ -2,25 +2,83 @@
 Klasse zur Generierung von Hintergrundmusik für die verschiedenen Dimensionen.
 """
 import numpy as np
-import io
+from concurrent.futures import ThreadPoolExecutor
 from game.constants import *
+from game.audio import oscillator
+from game.audio.oscillator import sine_wave, ar_envelope, to_int16
+from game.audio.audio_cache import AudioCache
+
+class Score:
+    """Notenfolge einer Stimme im Structure-of-Arrays-Layout; alle Noten sind gleich lang."""
+    __slots__ = ('notes', 'amps', 'note_samples')
+    
+    def __init__(self, sequence, note_samples, amplitude=1.0):
+        # Tonleiterstufen als int16, Pausen (None) als -1
+        self.notes = np.array([-1 if note is None else note for note in sequence], dtype=np.int16)
+        # Lautstärke pro Note, Pausen sind stumm
+        self.amps = np.where(self.notes < 0, 0.0, amplitude).astype(np.float32)
+        self.note_samples = note_samples
 
 class MusicGenerator:
+    BASE_FREQUENCY = 261.63  # C4
+    
+    # Tonleitern als Halbtonschritte über dem Grundton
+    SCALE_MAJOR = np.array([0, 2, 4, 5, 7, 9, 11])  # C-Dur: C, D, E, F, G, A, B
+    SCALE_MINOR = np.array([0, 2, 3, 5, 7, 8, 10])  # Moll-Tonleiter
+    SCALE_LYDIAN = np.array([0, 2, 4, 6, 7, 9, 11])  # Lydischer Modus
+    
     def __init__(self):
         """Initialisiert den Musikgenerator."""
-        pass
+        # Berechnete Musik wird auf der Festplatte zwischengespeichert
+        self.cache = AudioCache(__file__, oscillator.__file__)
+        
+        # Frequenztabellen der Tonleitern, einmalig berechnet
+        self.freq_major = self.BASE_FREQUENCY * 2 ** (self.SCALE_MAJOR / 12)
+        self.freq_minor = self.BASE_FREQUENCY * 2 ** (self.SCALE_MINOR / 12)
+        self.freq_lydian = self.BASE_FREQUENCY * 2 ** (self.SCALE_LYDIAN / 12)
     
     def generate_all_music(self):
         """Generiert Musik für alle Dimensionen und gibt ein Dictionary mit Musik-Objekten zurück."""
-        music = {
-            DIMENSION_NORMAL: self.generate_normal_dimension_music(),
-            DIMENSION_MIRROR: self.generate_mirror_dimension_music(),
-            DIMENSION_TIME_SLOW: self.generate_time_dimension_music()
+        tracks = {
+            DIMENSION_NORMAL: ("normal-90bpm", self._synthesize_normal_dimension_music),
+            DIMENSION_MIRROR: ("mirror-90bpm", self._synthesize_mirror_dimension_music),
+            DIMENSION_TIME_SLOW: ("time-60bpm", self._synthesize_time_dimension_music)
         }
+        
+        # Nur fehlende Stücke werden synthetisiert; NumPy gibt währenddessen den GIL frei.
+        # Eigene Prozesse lohnen sich bei wenigen Millisekunden pro Stück nicht.
+        missing = [dimension for dimension, (tag, _) in tracks.items() if tag not in self.cache]
+        results = {}
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {dimension: executor.submit(tracks[dimension][1]) for dimension in missing}
+                results = {dimension: future.result() for dimension, future in futures.items()}
+        
+        music = {}
+        for dimension, (tag, synthesize) in tracks.items():
+            if dimension in results:
+                synthesize = lambda pcm=results[dimension]: pcm
+            music[dimension] = self._cached_music(tag, synthesize)
         return music
     
     def generate_normal_dimension_music(self):
         """Generiert Musik für die normale Dimension."""
+        return self._cached_music("normal-90bpm", self._synthesize_normal_dimension_music)
+    
+    def generate_mirror_dimension_music(self):
+        """Generiert Musik für die Spiegel-Dimension."""
+        return self._cached_music("mirror-90bpm", self._synthesize_mirror_dimension_music)
+    
+    def generate_time_dimension_music(self):
+        """Generiert Musik für die Zeitdimension."""
+        return self._cached_music("time-60bpm", self._synthesize_time_dimension_music)
+    
+    def _cached_music(self, tag, synthesize):
+        """Lädt Musik aus dem Cache oder synthetisiert sie; liefert 16-bit signed Mono-PCM als Bytes."""
+        return self.cache.get_or_create(tag, synthesize)
+    
+    def _synthesize_normal_dimension_music(self):
+        """Synthetisiert die Musik für die normale Dimension als PCM-Bytes."""
         # Eine einfache Melodie für die normale Dimension
         sample_rate = 44100
         bpm = 90  # Beats pro Minute
@@ -29,304 +87,228 @@ class MusicGenerator:
         # 8 Takte mit je 4 Beats
         duration = beat_length * 4 * 8
         
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = np.linspace(0, duration, int(sample_rate * duration), False, dtype=np.float32)
         
-        music = np.zeros_like(t, dtype=float)
+        music = np.zeros_like(t)
         
-        # Melodiemuster definieren (C-Dur-Tonleiter: C, D, E, F, G, A, B)
-        base_freq = 261.63  # C4
-        notes = [0, 2, 4, 5, 7, 9, 11]  # Halbtonschritte in der Durtonleiter
+        # Melodiemuster in der C-Dur-Tonleiter
+        note_duration = beat_length / 2  # Sechzehntel-Noten
+        note_samples = int(round(note_duration * sample_rate))
+        beat_samples = int(round(beat_length * sample_rate))
         
-        melody = [0, 2, 4, 2, 0, 2, 4, 7,
-                 4, 2, 0, 2, 4, 7, 4, 2,
-                 0, 2, 4, 2, 0, 2, 4, 7,
-                 4, 2, 0, 2, 4, 7, 4, 2]
+        melody = Score([0, 2, 4, 2, 0, 2, 4, 7,
+                        4, 2, 0, 2, 4, 7, 4, 2,
+                        0, 2, 4, 2, 0, 2, 4, 7,
+                        4, 2, 0, 2, 4, 7, 4, 2], note_samples)
         
         # Bass hinzufügen
-        bass = [0, 0, 4, 4, 5, 5, 7, 7] * 4
+        bass = Score([0, 0, 4, 4, 5, 5, 7, 7] * 4, beat_samples)
         bass_octave = -1  # Eine Oktave tiefer
         
-        note_duration = beat_length / 2  # Sechzehntel-Noten
-        
         # Melodie rendern
-        music = self._render_melody(t, sample_rate, music, base_freq, notes, melody, note_duration)
+        music = self._render_melody(sample_rate, music, self.freq_major, melody)
         
         # Bass rendern
-        music = self._render_bass(t, sample_rate, music, base_freq, notes, bass, bass_octave, beat_length)
+        music = self._render_bass(sample_rate, music, self.freq_major, bass, bass_octave)
         
         # Normalisieren und konvertieren
-        music = np.int16(music / np.max(np.abs(music)) * 32767 * 0.7)
-        
-        # BytesIO-Objekt erstellen und zurückgeben
-        buffer = io.BytesIO()
+        music = to_int16(music, 0.7)
         
-        # 16-bit signed Integers, Mono-Audio
-        buffer.write(music.tobytes())
-        buffer.seek(0)
-        
-        return buffer
+        return music.tobytes()
     
-    def generate_mirror_dimension_music(self):
-        """Generiert Musik für die Spiegel-Dimension."""
+    def _synthesize_mirror_dimension_music(self):
+        """Synthetisiert die Musik für die Spiegel-Dimension als PCM-Bytes."""
         # Für Spiegeldimension: die normale Melodie, aber mit einigen Änderungen
         sample_rate = 44100
         bpm = 90
         beat_length = 60 / bpm
         
         duration = beat_length * 4 * 8
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = np.linspace(0, duration, int(sample_rate * duration), False, dtype=np.float32)
         
-        music = np.zeros_like(t, dtype=float)
+        music = np.zeros_like(t)
         
         # Melodiemuster, aber in Moll statt Dur
-        base_freq = 261.63  # C4
-        notes_minor = [0, 2, 3, 5, 7, 8, 10]  # Moll-Tonleiter
-        
         # Umgekehrte Melodie für Spiegeldimension
-        melody = [7, 4, 2, 0, 2, 4, 7, 4,
-                 2, 4, 7, 4, 2, 0, 2, 4,
-                 7, 4, 2, 0, 2, 4, 7, 4,
-                 2, 4, 7, 4, 2, 0, 2, 0]
+        note_duration = beat_length / 2
+        note_samples = int(round(note_duration * sample_rate))
+        beat_samples = int(round(beat_length * sample_rate))
+        
+        melody = Score([7, 4, 2, 0, 2, 4, 7, 4,
+                        2, 4, 7, 4, 2, 0, 2, 4,
+                        7, 4, 2, 0, 2, 4, 7, 4,
+                        2, 4, 7, 4, 2, 0, 2, 0], note_samples)
         
         # Bass auch umgekehrt
-        bass = [7, 7, 5, 5, 4, 4, 0, 0] * 4
+        bass = Score([7, 7, 5, 5, 4, 4, 0, 0] * 4, beat_samples)
         bass_octave = -1
         
-        note_duration = beat_length / 2
-        
         # Echo-Effekt hinzufügen
         echo_delay = int(0.25 * sample_rate)  # 250ms Verzögerung
         echo_strength = 0.3
         
         # Melodie rendern mit Echo-Effekt
-        music = self._render_melody_with_echo(t, sample_rate, music, base_freq, notes_minor, 
-                                              melody, note_duration, echo_delay, echo_strength)
+        music = self._render_melody_with_echo(sample_rate, music, self.freq_minor, 
+                                              melody, echo_delay, echo_strength)
         
         # Bass rendern
-        music = self._render_bass(t, sample_rate, music, base_freq, notes_minor, 
-                                  bass, bass_octave, beat_length)
+        music = self._render_bass(sample_rate, music, self.freq_minor, bass, bass_octave)
         
         # Reverb-Effekt simulieren durch mehrere verzögerte Echos
         reverb_music = music.copy()
-        for delay in [int(0.1 * sample_rate), int(0.15 * sample_rate), int(0.2 * sample_rate)]:
-            reverb_strength = 0.2 * (1 - delay / (0.3 * sample_rate))
-            reverb = np.zeros_like(music)
-            reverb[delay:] = music[:-delay] * reverb_strength
-            reverb_music += reverb
+        reverb_delays = [int(0.1 * sample_rate), int(0.15 * sample_rate), int(0.2 * sample_rate)]
+        reverb_strengths = 0.2 * (1 - np.array(reverb_delays) / (0.3 * sample_rate))
+        for delay, reverb_strength in zip(reverb_delays, reverb_strengths):
+            # Direkt in den Ausgabepuffer addieren, ohne Zwischenpuffer
+            reverb_music[delay:] += music[:music.size - delay] * np.float32(reverb_strength)
         
         music = reverb_music
         
         # Normalisieren und konvertieren
-        music = np.int16(music / np.max(np.abs(music)) * 32767 * 0.7)
-        
-        buffer = io.BytesIO()
-        buffer.write(music.tobytes())
-        buffer.seek(0)
+        music = to_int16(music, 0.7)
         
-        return buffer
+        return music.tobytes()
     
-    def generate_time_dimension_music(self):
-        """Generiert Musik für die Zeitdimension."""
+    def _synthesize_time_dimension_music(self):
+        """Synthetisiert die Musik für die Zeitdimension als PCM-Bytes."""
         # Für die Zeitdimension: langsameres Tempo, verträumtere Klänge
         sample_rate = 44100
         bpm = 60  # Langsameres Tempo
         beat_length = 60 / bpm
         
         duration = beat_length * 4 * 8
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = np.linspace(0, duration, int(sample_rate * duration), False, dtype=np.float32)
         
-        music = np.zeros_like(t, dtype=float)
+        music = np.zeros_like(t)
         
-        base_freq = 261.63  # C4
         # Lydischer Modus für einen "schwebenden" Klang
-        notes_lydian = [0, 2, 4, 6, 7, 9, 11]
-        
         # Eine langsamere, ausgedehnte Melodie
-        melody = [0, None, 4, None, 7, None, 9, None,
-                 7, None, 4, None, 2, None, 0, None,
-                 0, None, 4, None, 7, None, 9, None,
-                 7, None, 11, None, 12, None, 9, None]
+        note_duration = beat_length / 2
+        note_samples = int(round(note_duration * sample_rate))
+        beat_samples = int(round(beat_length * sample_rate))
         
-        # Drone-Bass für stetigen, meditativeren Klang
-        bass = [0, None, None, None, 5, None, None, None] * 4
-        bass_octave = -2
+        melody = Score([0, None, 4, None, 7, None, 9, None,
+                        7, None, 4, None, 2, None, 0, None,
+                        0, None, 4, None, 7, None, 9, None,
+                        7, None, 11, None, 12, None, 9, None], note_samples)
         
-        note_duration = beat_length / 2
+        # Drone-Bass für stetigen, meditativeren Klang (halbe Lautstärke)
+        bass = Score([0, None, None, None, 5, None, None, None] * 4, beat_samples, amplitude=0.5)
+        bass_octave = -2
         
         # Melodie rendern mit Pad-Sound
-        for i, note in enumerate(melody):
-            start = int(i * note_duration * sample_rate)
-            end = int((i + 1) * note_duration * sample_rate)
-            
-            if end > len(t):
-                break
-                
-            if note is not None:
-                freq = base_freq * 2 ** (notes_lydian[note % len(notes_lydian)] / 12)
-                
-                # Längere Attack- und Release-Zeiten für träumerischen Effekt
-                attack = int(min(0.1 * sample_rate, (end - start) * 0.3))
-                release = int(min(0.2 * sample_rate, (end - start) * 0.5))
-                
-                note_sound = self._generate_pad(freq, end - start, attack, release, sample_rate)
-                
-                if start + len(note_sound) <= len(music):
-                    music[start:start + len(note_sound)] += note_sound
+        freqs = self._note_frequencies(self.freq_lydian, melody)
+        # Längere Attack- und Release-Zeiten für träumerischen Effekt
+        attack = int(min(0.1 * sample_rate, note_samples * 0.3))
+        release = int(min(0.2 * sample_rate, note_samples * 0.5))
+        self._render_pads(music, sample_rate, freqs, melody, attack, release)
         
         # Bass rendern (tiefer, mit längerem Sustain)
-        for i, note in enumerate(bass):
-            start = int(i * beat_length * sample_rate)
-            end = int((i + 1) * beat_length * sample_rate)
-            
-            if end > len(t):
-                break
-                
-            if note is not None:
-                freq = base_freq * 2 ** (bass_octave + notes_lydian[note % len(notes_lydian)] / 12)
-                
-                # Sehr langer Sustain für den Bass
-                attack = int(min(0.2 * sample_rate, (end - start) * 0.2))
-                release = int(min(0.4 * sample_rate, (end - start) * 0.4))
-                
-                bass_sound = self._generate_pad(freq, end - start, attack, release, sample_rate) * 0.5
-                
-                if start + len(bass_sound) <= len(music):
-                    music[start:start + len(bass_sound)] += bass_sound
+        freqs = self._note_frequencies(self.freq_lydian, bass, octave=bass_octave)
+        # Sehr langer Sustain für den Bass
+        attack = int(min(0.2 * sample_rate, beat_samples * 0.2))
+        release = int(min(0.4 * sample_rate, beat_samples * 0.4))
+        self._render_pads(music, sample_rate, freqs, bass, attack, release)
         
         # Einen subtilen Zeiteffekt hinzufügen
-        time_effect = np.zeros_like(music)
-        for i in range(0, len(music), int(sample_rate * 0.5)):
-            if i + sample_rate < len(music):
-                time_effect[i:i+sample_rate] += np.sin(2 * np.pi * 8000 * t[0:sample_rate]) * 0.01
-        
-        music += time_effect
+        time_click = sine_wave(8000, sample_rate, sample_rate) * 0.01
+        for i in range(0, len(music) - sample_rate, int(sample_rate * 0.5)):
+            music[i:i+sample_rate] += time_click
         
         # Normalisieren und konvertieren
-        music = np.int16(music / np.max(np.abs(music)) * 32767 * 0.7)
-        
-        buffer = io.BytesIO()
-        buffer.write(music.tobytes())
-        buffer.seek(0)
+        music = to_int16(music, 0.7)
         
-        return buffer
+        return music.tobytes()
     
-    def _render_melody(self, t, sample_rate, music, base_freq, notes, melody, note_duration):
+    def _render_melody(self, sample_rate, music, freq_table, melody):
         """Rendert eine Melodie mit den angegebenen Parametern."""
-        for i, note in enumerate(melody):
-            start = int(i * note_duration * sample_rate)
-            end = int((i + 1) * note_duration * sample_rate)
-            
-            if end > len(t):
-                break
-                
-            if note >= 0:  # -1 würde eine Pause sein
-                freq = base_freq * 2 ** (notes[note % len(notes)] / 12)
-                segment_t = t[start:end] - t[start]
-                note_env = np.ones(end - start)
-                
-                # ADSR-Hüllkurve
-                attack = int(min(0.02 * sample_rate, (end - start) * 0.1))
-                release = int(min(0.05 * sample_rate, (end - start) * 0.2))
-                
-                if attack > 0:
-                    note_env[:attack] = np.linspace(0, 1, attack)
-                if release > 0 and release < len(note_env):
-                    note_env[-release:] = np.linspace(1, 0, release)
-                    
-                note_sound = np.sin(2 * np.pi * freq * segment_t) * note_env * 0.3
-                
-                # Oberton hinzufügen
-                note_sound += np.sin(2 * np.pi * freq * 2 * segment_t) * note_env * 0.1
-                
-                if start + len(note_sound) <= len(music):
-                    music[start:start + len(note_sound)] += note_sound
+        freqs = self._note_frequencies(freq_table, melody)
+        
+        # ADSR-Hüllkurve
+        attack = int(min(0.02 * sample_rate, melody.note_samples * 0.1))
+        release = int(min(0.05 * sample_rate, melody.note_samples * 0.2))
+        
+        # Grundton mit Oberton, alle Noten in einem Durchgang
+        notes_block = self._render_notes(music, sample_rate, freqs, melody, attack, release,
+                                         ((1, 0.3), (2, 0.1)))
+        music[:len(notes_block)] += notes_block
         
         return music
     
-    def _render_melody_with_echo(self, t, sample_rate, music, base_freq, notes, melody, 
-                                 note_duration, echo_delay, echo_strength):
+    def _render_melody_with_echo(self, sample_rate, music, freq_table, melody, 
+                                 echo_delay, echo_strength):
         """Rendert eine Melodie mit Echo-Effekt."""
-        for i, note in enumerate(melody):
-            start = int(i * note_duration * sample_rate)
-            end = int((i + 1) * note_duration * sample_rate)
-            
-            if end > len(t):
-                break
-                
-            if note >= 0:
-                freq = base_freq * 2 ** (notes[note % len(notes)] / 12)
-                segment_t = t[start:end] - t[start]
-                note_env = np.ones(end - start)
-                
-                attack = int(min(0.02 * sample_rate, (end - start) * 0.1))
-                release = int(min(0.05 * sample_rate, (end - start) * 0.2))
-                
-                if attack > 0:
-                    note_env[:attack] = np.linspace(0, 1, attack)
-                if release > 0 and release < len(note_env):
-                    note_env[-release:] = np.linspace(1, 0, release)
-                    
-                # Etwas mehr Obertöne für gespenstischeren Klang
-                note_sound = np.sin(2 * np.pi * freq * segment_t) * note_env * 0.3
-                note_sound += np.sin(2 * np.pi * freq * 2 * segment_t) * note_env * 0.15
-                note_sound += np.sin(2 * np.pi * freq * 3 * segment_t) * note_env * 0.05
-                
-                if start + len(note_sound) <= len(music):
-                    music[start:start + len(note_sound)] += note_sound
-                    
-                    # Echo hinzufügen
-                    echo_start = start + echo_delay
-                    if echo_start + len(note_sound) <= len(music):
-                        music[echo_start:echo_start + len(note_sound)] += note_sound * echo_strength
+        freqs = self._note_frequencies(freq_table, melody)
+        
+        attack = int(min(0.02 * sample_rate, melody.note_samples * 0.1))
+        release = int(min(0.05 * sample_rate, melody.note_samples * 0.2))
+        
+        # Etwas mehr Obertöne für gespenstischeren Klang
+        notes_block = self._render_notes(music, sample_rate, freqs, melody, attack, release,
+                                         ((1, 0.3), (2, 0.15), (3, 0.05)))
+        music[:len(notes_block)] += notes_block
+        
+        # Echo hinzufügen (nur für Noten, deren Echo vollständig hineinpasst)
+        echo_notes = min(len(notes_block), len(music) - echo_delay) // melody.note_samples
+        if echo_notes > 0:
+            echo_length = echo_notes * melody.note_samples
+            music[echo_delay:echo_delay + echo_length] += notes_block[:echo_length] * echo_strength
         
         return music
     
-    def _render_bass(self, t, sample_rate, music, base_freq, notes, bass, bass_octave, beat_length):
+    def _render_bass(self, sample_rate, music, freq_table, bass, bass_octave):
         """Rendert eine Basslinie mit den angegebenen Parametern."""
-        for i, note in enumerate(bass):
-            start = int(i * beat_length * sample_rate)
-            end = int((i + 1) * beat_length * sample_rate)
-            
-            if end > len(t):
-                break
-                
-            if note >= 0:
-                freq = base_freq * 2 ** (bass_octave + notes[note % len(notes)] / 12)
-                segment_t = t[start:end] - t[start]
-                note_env = np.ones(end - start)
-                
-                # Längerer Release für den Bass
-                attack = int(min(0.05 * sample_rate, (end - start) * 0.1))
-                release = int(min(0.3 * sample_rate, (end - start) * 0.7))
-                
-                if attack > 0:
-                    note_env[:attack] = np.linspace(0, 1, attack)
-                if release > 0 and release < len(note_env):
-                    note_env[-release:] = np.linspace(1, 0, release)
-                    
-                bass_sound = np.sin(2 * np.pi * freq * segment_t) * note_env * 0.4
-                
-                if start + len(bass_sound) <= len(music):
-                    music[start:start + len(bass_sound)] += bass_sound
+        freqs = self._note_frequencies(freq_table, bass, bass_octave)
+        
+        # Längerer Release für den Bass
+        attack = int(min(0.05 * sample_rate, bass.note_samples * 0.1))
+        release = int(min(0.3 * sample_rate, bass.note_samples * 0.7))
+        
+        bass_block = self._render_notes(music, sample_rate, freqs, bass, attack, release,
+                                        ((1, 0.4),))
+        music[:len(bass_block)] += bass_block
         
         return music
     
+    def _note_frequencies(self, freq_table, score, octave=0):
+        """Schlägt die Frequenzen aller Noten einer Stimme nach (Pausen werden über score.amps stumm geschaltet)."""
+        return freq_table[score.notes % len(freq_table)] * 2.0 ** octave
+    
+    def _render_notes(self, music, sample_rate, freqs, score, attack, release, partials):
+        """
+        Rendert die Noten einer Stimme vektorisiert und gibt sie als zusammenhängenden Block zurück.
+        partials enthält (Frequenzvielfaches, Amplitude)-Paare für Grundton und Obertöne.
+        """
+        # Nur so viele Noten, wie vollständig in den Musikpuffer passen
+        note_samples = score.note_samples
+        n_notes = min(len(freqs), len(music) // note_samples)
+        freqs = freqs[:n_notes]
+        
+        # Eine Zeile (note_samples) pro Note, alle Noten gleichzeitig
+        wave = np.zeros((n_notes, note_samples), dtype=np.float32)
+        for multiple, amplitude in partials:
+            wave += sine_wave(freqs * multiple, note_samples, sample_rate) * amplitude
+        
+        # Gemeinsame Hüllkurve, dann Lautstärke pro Note (Pausen haben Amplitude 0)
+        wave *= ar_envelope(note_samples, attack, release)
+        wave *= score.amps[:n_notes, np.newaxis]
+        
+        return wave.ravel()
+    
+    def _render_pads(self, music, sample_rate, freqs, score, attack, release):
+        """Rendert alle Pad-Noten einer Stimme als Block direkt in den Musikpuffer."""
+        n_notes = min(len(freqs), len(music) // score.note_samples)
+        pads = self._generate_pad(freqs[:n_notes], score.note_samples, attack, release, sample_rate)
+        pads *= score.amps[:n_notes, np.newaxis]
+        music[:pads.size] += pads.ravel()
+    
     def _generate_pad(self, freq, duration_samples, attack_samples, release_samples, sample_rate):
         """Generiert einen Pad-Sound mit der angegebenen Frequenz und Hüllkurve."""
-        t_pad = np.linspace(0, duration_samples / sample_rate, duration_samples)
-        
         # Mehrere Sinuswellen mit leicht verstimmten Frequenzen für einen reicheren Klang
-        sound = np.sin(2 * np.pi * freq * t_pad) * 0.3
-        sound += np.sin(2 * np.pi * (freq * 1.01) * t_pad) * 0.2
-        sound += np.sin(2 * np.pi * (freq * 0.99) * t_pad) * 0.2
-        sound += np.sin(2 * np.pi * (freq * 2) * t_pad) * 0.1
-        
-        # Sanfte Hüllkurve
-        envelope = np.ones_like(sound)
-        
-        if attack_samples > 0:
-            envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-        if release_samples > 0 and release_samples < len(envelope):
-            envelope[-release_samples:] = np.linspace(1, 0, release_samples)
-            
-        return sound * envelope 
\ No newline at end of file
+        detune_ratios = np.array([1.0, 1.01, 0.99, 2.0])
+        amplitudes = np.array([0.3, 0.2, 0.2, 0.1], dtype=np.float32)
+        oscillators = sine_wave(np.multiply.outer(freq, detune_ratios), duration_samples, sample_rate)
+        sound = amplitudes @ oscillators
+        
+        # Sanfte Hüllkurve (eindimensional, damit sie auch auf einen Notenblock passt)
+        return sound * ar_envelope(duration_samples, attack_samples, release_samples) 
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+Wavetable-Oszillator mit einer gemeinsamen Sinus-Lookup-Tabelle, Hüllkurven und
+PCM-Konvertierung für Musik und Sound-Effekte.
+"""
+import numpy as np
+
+# Tabellengröße (Zweierpotenz, damit der Index per Bitmaske gebildet werden kann)
+SINE_TABLE_SIZE = 4096
+_TABLE_MASK = SINE_TABLE_SIZE - 1
+
+# 32-Bit-Phasenakkumulator: die oberen 12 Bit indizieren die Tabelle
+_PHASE_SHIFT = 32 - 12
+
+_SINE_LUT = np.sin(2 * np.pi * np.arange(SINE_TABLE_SIZE) / SINE_TABLE_SIZE).astype(np.float32)
+
+# Bereits berechnete Hüllkurven, Schlüssel (Länge, Attack, Release)
+_envelope_cache = {}
+
+
+def sine_wave(freq, n_samples, sample_rate, offset=0):
+    """
+    Erzeugt Sinuswellen konstanter Frequenz über einen ganzzahligen Phasenakkumulator.
+    freq darf ein Skalar oder ein Array sein; bei einem Array entsteht eine Zeile pro Frequenz.
+    offset verschiebt den Startzeitpunkt um die angegebene Anzahl Samples; als Array
+    (passend zu freq) erhält jede Zeile ihren eigenen Startzeitpunkt.
+    """
+    # Phasenschritt pro Sample als 32-Bit-Festkommazahl (Überlauf = Phasen-Wrap)
+    steps = (np.asarray(freq, dtype=np.float64) / sample_rate * 2 ** 32).astype(np.uint64).astype(np.uint32)
+    sample_idx = np.asarray(offset, dtype=np.uint32)[..., np.newaxis] + np.arange(n_samples, dtype=np.uint32)
+
+    phase_acc = steps[..., np.newaxis] * sample_idx
+    return _SINE_LUT[(phase_acc >> _PHASE_SHIFT) & _TABLE_MASK]
+
+
+def sine_lookup(cycles):
+    """Liefert sin(2 * pi * cycles) über die Lookup-Tabelle; cycles ist die Phase in Perioden."""
+    idx = (np.asarray(cycles) * SINE_TABLE_SIZE).astype(np.int64) & _TABLE_MASK
+    return _SINE_LUT[idx]
+
+
+def ar_envelope(n_samples, attack, release):
+    """
+    Liefert eine Attack/Release-Hüllkurve mit linearen Rampen.
+    Gleiche Parameter teilen sich ein schreibgeschütztes Array, daher nur lesend verwenden.
+    """
+    key = (n_samples, attack, release)
+    envelope = _envelope_cache.get(key)
+    if envelope is None:
+        envelope = np.ones(n_samples, dtype=np.float32)
+        if attack > 0:
+            envelope[:attack] = np.linspace(0, 1, attack)
+        if release > 0 and release < n_samples:
+            envelope[-release:] = np.linspace(1, 0, release)
+        envelope.flags.writeable = False
+        _envelope_cache[key] = envelope
+    return envelope
+
+
+def to_int16(samples, gain=1.0):
+    """
+    Normalisiert samples auf den Spitzenwert, skaliert mit gain und wandelt in 16-Bit-PCM um.
+    Das float-Array wird dabei in-place überschrieben.
+    """
+    peak = max(samples.max(), -samples.min())
+    samples *= np.float32(32767 * gain / peak)
+    return samples.astype(np.int16)
@@ -3,44 +3,78 @@ Klasse zur Generierung von Sound-Effekten für das Spiel.
 """
 import pygame
 import numpy as np
+from collections.abc import Mapping
+from game.audio import oscillator
+from game.audio.oscillator import sine_wave, sine_lookup, ar_envelope, to_int16
+from game.audio.audio_cache import AudioCache
+from game.constants import AUDIO_CHANNELS
+
+
+class LazySounds(Mapping):
+    """Nur-Lese-Dictionary, das jeden Sound erst beim ersten Zugriff erzeugt."""
+    
+    def __init__(self, generators, load):
+        """generators ordnet Namen Erzeugerfunktionen zu, load(name, generator) liefert den Sound."""
+        self._generators = generators
+        self._load = load
+        self._sounds = {}
+    
+    def __getitem__(self, name):
+        """Erzeugt den Sound beim ersten Zugriff und merkt ihn sich."""
+        if name not in self._sounds:
+            self._sounds[name] = self._load(name, self._generators[name])
+        return self._sounds[name]
+    
+    def __contains__(self, name):
+        # Nicht über __getitem__ prüfen, sonst würde der Sound erzeugt
+        return name in self._generators
+    
+    def __iter__(self):
+        return iter(self._generators)
+    
+    def __len__(self):
+        return len(self._generators)
+
 
 class SoundEffects:
     def __init__(self):
         """Initialisiert die Sound-Effects-Klasse."""
-        pass
-    
-    def generate_all_sounds(self):
-        """Generiert alle Sound-Effekte und gibt ein Dictionary mit Sound-Objekten zurück."""
-        sounds = {}
-        
-        # Jump-Sound
-        sounds["jump"] = self.generate_jump_sound()
-        
-        # Collect-Sound
-        sounds["collect"] = self.generate_collect_sound()
-        
-        # Dimension-Shift-Sound
-        sounds["dimension_shift"] = self.generate_dimension_shift_sound()
-        
-        # Enemy-Death-Sound
-        sounds["enemy_death"] = self.generate_enemy_death_sound()
-        
-        # Player-Death-Sound
-        sounds["player_death"] = self.generate_player_death_sound()
+        # Fester Seed für das Rauschen, damit die Sounds reproduzierbar (und cachebar) sind
+        self.noise_seed = 0xA5A5
         
-        # Portal-Sound
-        sounds["portal"] = self.generate_portal_sound()
+        # Erzeugte Sounds werden auf der Festplatte zwischengespeichert
+        self.cache = AudioCache(__file__, oscillator.__file__)
         
-        # Button-Sound
-        sounds["button"] = self.generate_button_sound()
-        
-        # Schritte
-        sounds["step"] = self.generate_step_sound()
-        
-        # Levelabschluss
-        sounds["level_complete"] = self.generate_level_complete_sound()
-        
-        return sounds
+        # Gemeinsamer Zeitvektor (2 Sekunden bei 44,1 kHz); jeder Sound nutzt einen Ausschnitt davon
+        self._t = np.arange(2 * 44100, dtype=np.float32) / np.float32(44100)
+    
+    def generate_all_sounds(self):
+        """
+        Gibt ein Dictionary mit allen Sound-Effekten zurück.
+        Die Sounds werden erst beim ersten Zugriff erzeugt (bzw. aus dem Cache geladen).
+        """
+        return LazySounds({
+            "jump": self.generate_jump_sound,
+            "collect": self.generate_collect_sound,
+            "dimension_shift": self.generate_dimension_shift_sound,
+            "enemy_death": self.generate_enemy_death_sound,
+            "player_death": self.generate_player_death_sound,
+            "portal": self.generate_portal_sound,
+            "button": self.generate_button_sound,
+            "step": self.generate_step_sound,
+            "level_complete": self.generate_level_complete_sound,
+            "powerup": self.generate_powerup_sound
+        }, self._cached_sound)
+    
+    def _cached_sound(self, name, generate):
+        """Lädt einen Sound aus dem Cache oder erzeugt ihn und speichert seine PCM-Daten."""
+        data = self.cache.get_or_create(name, lambda: generate().get_raw())
+        return pygame.mixer.Sound(buffer=data)
+    
+    def _noise(self, low, high, n_samples):
+        """Erzeugt gleichverteiltes float32-Rauschen; jeder Sound startet mit demselben Seed."""
+        rng = np.random.default_rng(self.noise_seed)
+        return low + (high - low) * rng.random(n_samples, dtype=np.float32)
     
     def generate_jump_sound(self):
         """Generiert einen Sprung-Sound."""
@@ -49,11 +83,11 @@ class SoundEffects:
         duration = 0.3  # Sekunden
         
         # Frequenzabfall von hoch nach niedrig
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        frequency = np.linspace(800, 400, len(t))
+        t = self._t[:int(sample_rate * duration)]
+        frequency = np.linspace(800, 400, len(t), dtype=np.float32)
         
         # Sinus-Welle mit variierender Frequenz
-        tone = np.sin(2 * np.pi * frequency * t)
+        tone = sine_lookup(frequency * t)
         
         # ADSR-Hüllkurve anwenden (Attack, Decay, Sustain, Release)
         envelope = np.ones_like(t)
@@ -72,7 +106,7 @@ class SoundEffects:
         tone = tone * envelope
         
         # Normalisieren
-        tone = np.int16(tone / np.max(np.abs(tone)) * 32767 * 0.7)
+        tone = to_int16(tone, 0.7)
         
         # In Bytes konvertieren und als Sound zurückgeben
         return pygame.mixer.Sound(tone.tobytes())
@@ -82,23 +116,21 @@ class SoundEffects:
         sample_rate = 44100
         duration = 0.2
         
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = self._t[:int(sample_rate * duration)]
         
         # Aufsteigende Tonfolge
-        tone1 = np.sin(2 * np.pi * 600 * t[:len(t)//2])
-        tone2 = np.sin(2 * np.pi * 900 * t[len(t)//2:])
+        half = len(t) // 2
+        tone1 = sine_wave(600, half, sample_rate)
+        tone2 = sine_wave(900, len(t) - half, sample_rate, half)
         tone = np.concatenate((tone1, tone2))
         
         # Schneller Attack und Release
-        envelope = np.ones_like(t)
         attack = int(0.01 * sample_rate)
         release = int(0.05 * sample_rate)
-        
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
+        envelope = ar_envelope(len(t), attack, release)
         
         tone = tone * envelope * 0.7
-        tone = np.int16(tone / np.max(np.abs(tone)) * 32767)
+        tone = to_int16(tone)
         
         return pygame.mixer.Sound(tone.tobytes())
     
@@ -107,35 +139,28 @@ class SoundEffects:
         sample_rate = 44100
         duration = 0.5
         
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = self._t[:int(sample_rate * duration)]
         
         # Komplexere Welle für Dimensionswechsel
-        frequencies = [300, 500, 700, 900, 700, 500, 300]
-        segments = len(frequencies)
-        segment_length = len(t) // segments
+        frequencies = np.array([300, 500, 700, 900, 700, 500, 300])
+        segment_length = len(t) // len(frequencies)
         
-        tone = np.zeros_like(t)
+        # Alle Segmente auf einmal erzeugen: eine Zeile pro Frequenz
+        offsets = np.arange(len(frequencies)) * segment_length
+        segments = sine_wave(frequencies, segment_length, sample_rate, offsets)
         
-        for i, freq in enumerate(frequencies):
-            start = i * segment_length
-            end = start + segment_length if i < segments - 1 else len(t)
-            segment_t = t[start:end]
-            segment = np.sin(2 * np.pi * freq * segment_t)
-            
-            # Jedem Segment ein eigenes Ein- und Ausblenden geben
-            segment_envelope = np.ones_like(segment)
-            fade = min(100, len(segment) // 4)
-            segment_envelope[:fade] = np.linspace(0, 1, fade)
-            segment_envelope[-fade:] = np.linspace(1, 0, fade)
-            
-            segment = segment * segment_envelope
-            tone[start:end] = segment
+        # Jedem Segment ein eigenes Ein- und Ausblenden geben
+        fade = min(100, segment_length // 4)
+        segments *= ar_envelope(segment_length, fade, fade)
+        
+        tone = np.zeros_like(t)
+        tone[:segments.size] = segments.ravel()
         
         # Einen Hauch von "Rauschen" hinzufügen für kosmischen Effekt
-        noise = np.random.uniform(-0.1, 0.1, len(t))
+        noise = self._noise(-0.1, 0.1, len(t))
         tone = tone + noise
         
-        tone = np.int16(tone / np.max(np.abs(tone)) * 32767 * 0.7)
+        tone = to_int16(tone, 0.7)
         
         return pygame.mixer.Sound(tone.tobytes())
     
@@ -144,26 +169,23 @@ class SoundEffects:
         sample_rate = 44100
         duration = 0.3
         
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = self._t[:int(sample_rate * duration)]
         
         # Abfallende Frequenz
-        frequency = np.linspace(300, 50, len(t))
-        tone = np.sin(2 * np.pi * frequency * t)
+        frequency = np.linspace(300, 50, len(t), dtype=np.float32)
+        tone = sine_lookup(frequency * t)
         
         # Rauschen hinzufügen
-        noise = np.random.uniform(-0.5, 0.5, len(t))
+        noise = self._noise(-0.5, 0.5, len(t))
         mixed = tone * 0.7 + noise * 0.3
         
         # Kurzer Attack, langer Release
-        envelope = np.ones_like(t)
         attack = int(0.01 * sample_rate)
         release = int(0.2 * sample_rate)
-        
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
+        envelope = ar_envelope(len(t), attack, release)
         
         mixed = mixed * envelope * 0.8
-        mixed = np.int16(mixed / np.max(np.abs(mixed)) * 32767)
+        mixed = to_int16(mixed)
         
         return pygame.mixer.Sound(mixed.tobytes())
     
@@ -172,29 +194,28 @@ class SoundEffects:
         sample_rate = 44100
         duration = 0.6
         
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = self._t[:int(sample_rate * duration)]
         
         # Abfallende Tonsequenz
-        tone1 = np.sin(2 * np.pi * 400 * t[:len(t)//3])
-        tone2 = np.sin(2 * np.pi * 300 * t[len(t)//3:2*len(t)//3])
-        tone3 = np.sin(2 * np.pi * 200 * t[2*len(t)//3:])
+        third = len(t) // 3
+        two_thirds = 2 * len(t) // 3
+        tone1 = sine_wave(400, third, sample_rate)
+        tone2 = sine_wave(300, two_thirds - third, sample_rate, third)
+        tone3 = sine_wave(200, len(t) - two_thirds, sample_rate, two_thirds)
         
         tone = np.concatenate((tone1, tone2, tone3))
         
         # Dramatischeren Klang mit Obertönen hinzufügen
-        overtone = np.sin(2 * np.pi * 800 * t) * 0.3
+        overtone = sine_wave(800, len(t), sample_rate) * 0.3
         tone = tone + overtone
         
         # Anwendung der Hüllkurve
-        envelope = np.ones_like(t)
         attack = int(0.05 * sample_rate)
         release = int(0.3 * sample_rate)
-        
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
+        envelope = ar_envelope(len(t), attack, release)
         
         tone = tone * envelope * 0.8
-        tone = np.int16(tone / np.max(np.abs(tone)) * 32767)
+        tone = to_int16(tone)
         
         return pygame.mixer.Sound(tone.tobytes())
     
@@ -203,31 +224,31 @@ class SoundEffects:
         sample_rate = 44100
         duration = 0.8
         
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = self._t[:int(sample_rate * duration)]
         
         # Aufsteigende Frequenz mit Vibrato
-        base_freq = np.linspace(200, 1000, len(t))
-        vibrato = 40 * np.sin(2 * np.pi * 10 * t)  # Vibrato mit 10 Hz
+        base_freq = np.linspace(200, 1000, len(t), dtype=np.float32)
+        vibrato = 40 * sine_wave(10, len(t), sample_rate)  # Vibrato mit 10 Hz
         freq = base_freq + vibrato
         
-        tone = np.sin(2 * np.pi * np.cumsum(freq) / sample_rate)
+        # Phase einmal integrieren; die verstimmten Stimmen skalieren nur diese Phase.
+        # Die Summe erreicht ~2e7 und braucht float64, erst die Phase in Perioden passt in float32.
+        phase = (np.cumsum(freq, dtype=np.float64) / sample_rate).astype(np.float32)
+        tone = sine_lookup(phase)
         
         # Einen "Chor"-Effekt hinzufügen
-        detune = np.sin(2 * np.pi * np.cumsum(freq * 1.01) / sample_rate) * 0.5
-        detune2 = np.sin(2 * np.pi * np.cumsum(freq * 0.99) / sample_rate) * 0.5
+        detune = sine_lookup(phase * 1.01) * 0.5
+        detune2 = sine_lookup(phase * 0.99) * 0.5
         
         tone = (tone + detune + detune2) / 3
         
         # Langsames Einblenden und Ausblenden
-        envelope = np.ones_like(t)
         attack = int(0.2 * sample_rate)
         release = int(0.3 * sample_rate)
-        
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
+        envelope = ar_envelope(len(t), attack, release)
         
         tone = tone * envelope * 0.7
-        tone = np.int16(tone / np.max(np.abs(tone)) * 32767)
+        tone = to_int16(tone)
         
         return pygame.mixer.Sound(tone.tobytes())
     
@@ -236,22 +257,19 @@ class SoundEffects:
         sample_rate = 44100
         duration = 0.1
         
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = self._t[:int(sample_rate * duration)]
         
         # Einfacher Klick-Ton
         frequency = 800
-        tone = np.sin(2 * np.pi * frequency * t)
+        tone = sine_wave(frequency, len(t), sample_rate)
         
         # Sehr kurzer Attack und schnelles Abklingen
-        envelope = np.ones_like(t)
         attack = int(0.005 * sample_rate)
         release = int(0.08 * sample_rate)
-        
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
+        envelope = ar_envelope(len(t), attack, release)
         
         tone = tone * envelope * 0.6
-        tone = np.int16(tone / np.max(np.abs(tone)) * 32767)
+        tone = to_int16(tone)
         
         return pygame.mixer.Sound(tone.tobytes())
     
@@ -260,24 +278,21 @@ class SoundEffects:
         sample_rate = 44100
         duration = 0.1
         
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = self._t[:int(sample_rate * duration)]
         
         # Ein kurzer, dumpfer Klang
-        tone = np.sin(2 * np.pi * 100 * t) * 0.5
-        noise = np.random.uniform(-0.5, 0.5, len(t)) * 0.5
+        tone = sine_wave(100, len(t), sample_rate) * 0.5
+        noise = self._noise(-0.5, 0.5, len(t)) * 0.5
         
         mixed = tone + noise
         
         # Schnelles Ein- und Ausblenden
-        envelope = np.ones_like(t)
         attack = int(0.01 * sample_rate)
         release = int(0.05 * sample_rate)
-        
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
+        envelope = ar_envelope(len(t), attack, release)
         
         mixed = mixed * envelope * 0.6
-        mixed = np.int16(mixed / np.max(np.abs(mixed)) * 32767)
+        mixed = to_int16(mixed)
         
         return pygame.mixer.Sound(mixed.tobytes())
     
@@ -286,48 +301,78 @@ class SoundEffects:
         sample_rate = 44100
         duration = 1.0
         
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        t = self._t[:int(sample_rate * duration)]
         
         # Aufsteigende Tonfolge für "Erfolg"
-        segments = 4
-        segment_length = len(t) // segments
-        
-        tones = []
-        frequencies = [440, 554, 659, 880]  # A, C#, E, A (A-Dur-Akkord)
-        
-        for i, freq in enumerate(frequencies):
-            start = i * segment_length
-            end = start + segment_length
-            segment_t = t[start:end]
-            segment = np.sin(2 * np.pi * freq * segment_t)
-            
-            # Harmonische Obertöne hinzufügen
-            overtone1 = np.sin(2 * np.pi * freq * 2 * segment_t) * 0.3
-            overtone2 = np.sin(2 * np.pi * freq * 3 * segment_t) * 0.15
-            segment = segment + overtone1 + overtone2
-            
-            # Jedes Segment ein- und ausblenden
-            envelope = np.ones_like(segment)
-            fade = min(int(0.1 * sample_rate), len(segment) // 4)
-            
-            envelope[:fade] = np.linspace(0, 1, fade)
-            envelope[-fade:] = np.linspace(1, 0, fade)
-            
-            segment = segment * envelope
-            tones.append(segment)
+        frequencies = np.array([440, 554, 659, 880])  # A, C#, E, A (A-Dur-Akkord)
+        segment_length = len(t) // len(frequencies)
+        
+        # Grundton und harmonische Obertöne aller Segmente in einem Aufruf
+        offsets = np.arange(len(frequencies)) * segment_length
+        harmonics = np.array([1, 2, 3])
+        amplitudes = np.array([1.0, 0.3, 0.15], dtype=np.float32)
+        partials = sine_wave(np.multiply.outer(frequencies, harmonics), segment_length, sample_rate, offsets[:, np.newaxis])
+        segments = amplitudes @ partials
+        
+        # Jedes Segment ein- und ausblenden
+        fade = min(int(0.1 * sample_rate), segment_length // 4)
+        segments *= ar_envelope(segment_length, fade, fade)
         
         # Alle Töne zusammenfügen
-        tone = np.concatenate(tones)
+        tone = segments.ravel()
         
         # Globale Hüllkurve anwenden
-        global_envelope = np.ones_like(tone)
         attack = int(0.05 * sample_rate)
         release = int(0.2 * sample_rate)
-        
-        global_envelope[:attack] = np.linspace(0, 1, attack)
-        global_envelope[-release:] = np.linspace(1, 0, release)
+        global_envelope = ar_envelope(len(tone), attack, release)
         
         tone = tone * global_envelope * 0.8
-        tone = np.int16(tone / np.max(np.abs(tone)) * 32767)
+        tone = to_int16(tone)
+        
+        return pygame.mixer.Sound(tone.tobytes())
+    
+    def generate_powerup_sound(self):
+        """Generiert einen Powerup-Sound."""
+        sample_rate = 44100
+        duration = 0.5
+        
+        t = self._t[:int(sample_rate * duration)]
+        n_samples = len(t)
+        third = n_samples // 3
+        freq = np.empty(n_samples, dtype=np.float32)
         
-        return pygame.mixer.Sound(tone.tobytes()) 
\ No newline at end of file
+        # Basisfrequenz für Powerup-Sound
+        base_freq = 800
+        
+        # Ansteigender Ton
+        freq[:third] = base_freq + np.arange(third, dtype=np.float32) * 2
+        
+        # Abfallender Ton mit Modulation
+        mod = 1 + 0.2 * sine_wave(25, n_samples - third, sample_rate, third)
+        freq[third:] = (base_freq + third * 2 - np.arange(n_samples - third, dtype=np.float32) * 1.5) * mod
+        
+        # Pegel direkt im 16-Bit-Bereich: Ton (0.5) plus Schimmer (0.2) sind nach oben
+        # begrenzt, daher entfallen Spitzenwertsuche, Normalisierung und Clipping
+        scale = np.float32(0.9 / 0.7 * 32767)
+        
+        # Phasenakkumulator: die Phase ist das Integral der Momentanfrequenz
+        tone = (0.5 * scale) * sine_lookup(np.cumsum(freq, dtype=np.float64) / sample_rate)
+        
+        # Hüllkurve anwenden
+        attack = int(0.01 * sample_rate)
+        release = int(0.1 * sample_rate)
+        tone *= ar_envelope(n_samples, attack, release)
+        
+        # Mit zusätzlichem hohen Klang mischen für glitzernden Effekt
+        tone += (0.2 * scale) * sine_wave(1600, n_samples, sample_rate) * np.exp(-5 * t)
+        
+        if AUDIO_CHANNELS == 2:
+            # Stereo-Effekt: von links nach rechts wandern, direkt in den PCM-Puffer
+            pos = t / np.float32(duration)
+            pcm = np.empty((n_samples, 2), dtype=np.int16)
+            np.multiply(tone, 1 - pos, out=pcm[:, 0], casting='unsafe')  # Links
+            np.multiply(tone, pos, out=pcm[:, 1], casting='unsafe')      # Rechts
+        else:
+            pcm = tone.astype(np.int16)
+        
+        return pygame.mixer.Sound(pcm.tobytes())
@@ -3,12 +3,14 @@ Enthält Konstanten und Konfigurationsparameter für das gesamte Spiel.
 """
 import pygame
 import math
+import numpy as np
 
 # Fenster und Spiel
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 TARGET_FPS = 60
 GAME_TITLE = "DimensionSwitch"
+DEBUG_OUTPUT = False  # Debug-Ausgaben auf der Konsole (Levelwechsel, Steuerung, Powerups)
 
 # Physik
 GRAVITY = 0.5
@@ -32,6 +34,7 @@ LEVEL_WIDTH = 3000
 LEVEL_HEIGHT = 1000
 CAMERA_SMOOTHING = 0.1
 BACKGROUND_PARTICLES = 150
+PLATFORM_GRID_CELL_SIZE = 128  # Zellgröße des Kollisionsrasters für Plattformen
 
 # Dimensionen
 MAX_DIMENSIONS = 4
@@ -39,6 +42,7 @@ DIMENSION_TRANSITION_TIME = 0.5
 DIMENSION_NORMAL = 1  # Normale Dimension
 DIMENSION_MIRROR = 2  # Spiegeldimension
 DIMENSION_TIME_SLOW = 3  # Zeitdehnungsdimension
+DIMENSION_QUANTUM = 4  # Quantendimension
 
 # Gegner
 ENEMY_WIDTH = 40
@@ -52,6 +56,7 @@ COLLECTIBLE_SIZE = 20
 COLLECTIBLE_SCORE = 10
 PORTAL_WIDTH = 60
 PORTAL_HEIGHT = 100
+PORTAL_COOLDOWN = 1.0  # Sekunden zwischen zwei Portal-Kollisionen
 
 # Spieler-Bewegungsparameter
 PLAYER_JUMP_STRENGTH = -16.0  # Negative Werte für Aufwärtsbewegung
@@ -135,6 +140,8 @@ TOGGLE_ACTIVE_COLOR = (80, 120, 200)
 TOGGLE_HANDLE_COLOR = (200, 200, 220)
 
 # Nützliche Funktionen
+# Skalare Hilfsfunktionen bewusst mit dem math-Modul: NumPy-Aufrufe auf einzelnen
+# Zahlen sind durch den Dispatch-Overhead um ein Vielfaches langsamer
 def get_angle_to_target(x1, y1, x2, y2):
     """Berechnet den Winkel zwischen zwei Punkten in Radiant."""
     dx = x2 - x1
@@ -143,14 +150,17 @@ def get_angle_to_target(x1, y1, x2, y2):
 
 def get_distance(x1, y1, x2, y2):
     """Berechnet die Entfernung zwischen zwei Punkten."""
-    dx = x2 - x1
-    dy = y2 - y1
-    return math.sqrt(dx * dx + dy * dy)
+    return math.hypot(x2 - x1, y2 - y1)
 
 def clamp(value, min_value, max_value):
     """Begrenzt einen Wert auf einen Bereich."""
     return max(min_value, min(value, max_value))
 
+def clamp_array(values, min_value, max_value):
+    """Begrenzt alle Werte eines NumPy-Arrays in-place auf den angegebenen Bereich."""
+    np.clip(values, min_value, max_value, out=values)
+    return values
+
 def lerp(start, end, t):
     """Lineare Interpolation zwischen zwei Werten."""
     return start + t * (end - start)
@@ -175,6 +185,7 @@ EXTRA_LIFE_COLOR = (50, 255, 50)    # Grün für Extra-Leben
 SAVE_DIRECTORY = "./saves/"
 SETTINGS_FILE = "settings.json"
 HIGHSCORE_FILE = "highscores.json"
+AUDIO_CACHE_DIRECTORY = SAVE_DIRECTORY + "audio_cache/"  # Vorberechnete Musik und Sound-Effekte
 
 # Standard-Tastenbelegung
 DEFAULT_CONTROLS = {
@@ -192,6 +203,7 @@ DEFAULT_SETTINGS = {
     "fullscreen": False,
     "particles_enabled": True,
     "show_minimap": True,
+    "low_latency": False,  # Frame-Takt per Busy-Wait statt Sleep (genauer, aber höhere CPU-Last)
     "difficulty": 1  # 0=Leicht, 1=Normal, 2=Schwer
 }
 
@@ -201,6 +213,11 @@ DIMENSION_2_COLOR = (200, 50, 50)     # Rot - Gespiegelt
 DIMENSION_3_COLOR = (50, 180, 50)     # Grün - Zeit-Paradox
 DIMENSION_4_COLOR = (180, 50, 180)    # Lila - Quantum
 
+# Dimensions-Farben als Array für vektorisierte Zugriffe, Index = Dimension - 1
+DIMENSION_COLORS_ARR = np.array([DIMENSION_1_COLOR, DIMENSION_2_COLOR,
+                                 DIMENSION_3_COLOR, DIMENSION_4_COLOR], dtype=np.uint8)
+DIMENSION_COLORS_ARR.flags.writeable = False
+
 # Partikel-Farben
 PARTICLE_COLORS = [
     (255, 255, 255),    # Weiß
@@ -209,6 +226,8 @@ PARTICLE_COLORS = [
     (255, 200, 200),    # Hellrot
     (200, 255, 200)     # Hellgrün
 ]
+PARTICLE_COLORS_ARR = np.array(PARTICLE_COLORS, dtype=np.uint8)
+PARTICLE_COLORS_ARR.flags.writeable = False
 
 # Explosions-Farben
 EXPLOSION_COLORS = [
@@ -218,6 +237,13 @@ EXPLOSION_COLORS = [
     (139, 0, 0),        # Dunkelrot
     (50, 50, 50)        # Dunkelgrau (Rauch)
 ]
+EXPLOSION_COLORS_ARR = np.array(EXPLOSION_COLORS, dtype=np.uint8)
+EXPLOSION_COLORS_ARR.flags.writeable = False
+
+# Audio-Ausgabe (alle Sounds und Musikstücke werden als 16-bit Mono mit 44,1 kHz erzeugt)
+AUDIO_SAMPLE_RATE = 44100
+AUDIO_CHANNELS = 1
+AUDIO_BUFFER_SIZE = 4096  # Samples pro Mixer-Puffer; größere Puffer vermeiden Aussetzer
 
 # Audio-Kategorien
 SOUND_CATEGORIES = {
@@ -1,6 +1,7 @@
 import pygame
 import time
 import random
+from collections import deque
 from game.constants import *
 from game.world import World
 from game.player import Player
@@ -9,6 +10,19 @@ from game.ui import MainMenu, SettingsMenu, ControlsMenu, PauseMenu, GameOverMen
 from typing import Dict
 
 class GameController:
+    # Ereignistypen, die Menüs bzw. das laufende Spiel auswerten; alle anderen werden verworfen
+    _MENU_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                         pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+    _GAME_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN)
+    
+    # Benachrichtigungen beim Einsammeln eines Powerups
+    _POWERUP_MESSAGES = {
+        "double_jump": "Doppelsprung aktiviert!",
+        "speed_boost": "Geschwindigkeitsboost aktiviert!",
+        "invincibility": "Unverwundbarkeit aktiviert!",
+        "extra_life": "Extra-Leben erhalten!"
+    }
+    
     def __init__(self):
         pygame.init()
         
@@ -30,6 +44,14 @@ class GameController:
         self.game_time = 0.0
         self.dimension_cooldown = 0.0
         
+        # Ende der kurzen Pause nach einem Levelwechsel (time.monotonic())
+        self._transition_until = 0.0
+        
+        # Aufgelöste Tastencodes und Zeitfaktor, damit pro Frame keine Dictionary-Zugriffe nötig sind
+        self._refresh_control_cache()
+        self._refresh_time_factor()
+        self._refresh_display_settings()
+        
         # Aktiver Menüzustand
         self.active_menu = None
         self.game_paused = False
@@ -46,12 +68,15 @@ class GameController:
         self._init_ui()
         
         # Performance-Tracking
-        self.frame_times = []
         self.max_frame_times = 60  # Speichere die letzten 60 Frames für Durchschnittsberechnung
-        self.last_frame_time = time.time()
+        self.frame_times = deque(maxlen=self.max_frame_times)
+        self.last_frame_time = time.monotonic()
         
-        # Initialisierung abschließen
-        self.initialize_game()
+        # FPS-Anzeige nur alle 15 Frames (4-mal pro Sekunde) aktualisieren
+        self._fps_display = 0
+        self._fps_counter = 0
+        
+        # Das erste Level wird erst in _start_game generiert; im Hauptmenü wird die Welt nicht gezeichnet
 
     def _init_ui(self):
         """Initialisiert alle UI-Komponenten."""
@@ -105,6 +130,9 @@ class GameController:
         # Startet mit dem Hauptmenü
         self.active_menu = self.main_menu
         self.previous_menu = None
+        
+        # Zuletzt vollständig angezeigtes Menü (für Teilaktualisierungen des Bildschirms)
+        self._presented_menu = None
 
     def _start_game(self):
         """Startet ein neues Spiel."""
@@ -115,13 +143,19 @@ class GameController:
         self.current_level = 0
         self.game_time = 0.0
         self.player.reset(100, 300)
-        self.world.generate_level(self.current_level)
+        self.world.reset(self.current_level)
         self.sound.play_music(self.current_dimension)
+        # Das Einstellungsmenü ändert das Settings-Dictionary direkt
+        self._refresh_time_factor()
+        self._refresh_display_settings()
         
     def _resume_game(self):
         """Setzt ein pausiertes Spiel fort."""
         self.game_paused = False
         self.active_menu = None
+        # Das Einstellungsmenü ändert das Settings-Dictionary direkt
+        self._refresh_time_factor()
+        self._refresh_display_settings()
         
     def _pause_game(self):
         """Pausiert das laufende Spiel."""
@@ -161,11 +195,13 @@ class GameController:
         """Speichert die Steuerungseinstellungen."""
         # Steuerung aktualisieren mit tiefer Kopie
         self.controls = controls.copy()
+        self._refresh_control_cache()
         
         # Debug-Ausgabe zur Überprüfung
-        print("Steuerung aktualisiert:")
-        for action, key in self.controls.items():
-            print(f"{action}: {pygame.key.name(key)}")
+        if DEBUG_OUTPUT:
+            print("Steuerung aktualisiert:")
+            for action, key in self.controls.items():
+                print(f"{action}: {pygame.key.name(key)}")
         
         # Zurück zum Einstellungsmenü
         self._back_to_settings()
@@ -174,6 +210,8 @@ class GameController:
         """Speichert die Spieleinstellungen."""
         # Settings aktualisieren
         self.settings = settings
+        self._refresh_time_factor()
+        self._refresh_display_settings()
         
         # Lautstärke aktualisieren
         self.sound.update_volume()
@@ -186,16 +224,43 @@ class GameController:
         # Zurück zum vorherigen Menü
         self._back_to_previous_menu()
         
-    def initialize_game(self):
-        """Initialisiert das Spiel."""
-        # Level explizit auf 0 setzen
-        self.current_level = 0
-        # Level mit aktueller Levelnummer generieren
-        self.world.generate_level(self.current_level)
+    def _refresh_control_cache(self):
+        """Liest die Tastenbelegung einmalig aus dem Controls-Dictionary."""
+        self._k_left = self.controls.get("move_left", pygame.K_LEFT)
+        self._k_right = self.controls.get("move_right", pygame.K_RIGHT)
+        self._k_jump = self.controls.get("jump", pygame.K_SPACE)
+        self._k_dim = self.controls.get("dimension_change", pygame.K_d)
+        self._k_pause = self.controls.get("pause", pygame.K_ESCAPE)
+    
+    def _refresh_time_factor(self):
+        """Berechnet den Zeitfaktor aus Dimension und Schwierigkeitsgrad neu."""
+        # Zeitfaktor je nach Dimension
+        time_factor = 0.5 if self.current_dimension == 3 else 1.0  # Dimension 3 = Zeit-Paradox
+        
+        # Zeitfaktor nach Schwierigkeitsgrad anpassen
+        if self.settings["difficulty"] == 0:  # Leicht
+            time_factor *= 0.9
+        elif self.settings["difficulty"] == 2:  # Schwer
+            time_factor *= 1.1
+        
+        self._time_factor = time_factor
+    
+    def _refresh_display_settings(self):
+        """Übernimmt die Anzeige-Einstellungen für HUD, Minimap und Frame-Takt."""
+        self._show_debug = self.settings.get("show_debug", False)
+        self._show_minimap = self.settings.get("show_minimap", True)
         
+        # tick() schläft bis zum nächsten Frame, tick_busy_loop() wartet aktiv und ist genauer
+        self._tick = self.clock.tick_busy_loop if self.settings.get("low_latency", False) else self.clock.tick
+    
     def handle_events(self):
         """Verarbeitet Spielereignisse."""
-        for event in pygame.event.get():
+        # Nach Typ gefiltert abholen, damit Python z. B. keine Mausbewegungen im Spiel sieht;
+        # der Rest wird ohne erneutes Pumpen verworfen, damit keine Tastendrücke verloren gehen
+        events = pygame.event.get(self._MENU_EVENT_TYPES if self.active_menu else self._GAME_EVENT_TYPES, pump=True)
+        pygame.event.clear(pump=False)
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return
@@ -207,33 +272,35 @@ class GameController:
                     self.sound.play_sound("button")
                 continue
                 
-            # Eingaben für das Spiel
+            # Eingaben für das Spiel: Pause, Sprung und Dimensionswechsel reagieren auf den Tastendruck
             if event.type == pygame.KEYDOWN:
                 # Aktuelle Kontrollen verwenden
-                if event.key == self.controls.get("pause", pygame.K_ESCAPE):
+                if event.key == self._k_pause:
                     self._pause_game()
                     self.sound.play_sound("button")
-        
-        # Spielsteuerung auswerten
-        if self.game_started and not self.game_paused:
-            keys = pygame.key.get_pressed()
-            
-            # Horizontale Bewegung - aktuelle Kontrollen verwenden
-            if keys[self.controls.get("move_left", pygame.K_LEFT)]:
-                self.player.move_left()
-            elif keys[self.controls.get("move_right", pygame.K_RIGHT)]:
-                self.player.move_right()
-            else:
-                self.player.stop_horizontal_movement()
-            
-            # Springen - aktuelle Kontrollen verwenden
-            if keys[self.controls.get("jump", pygame.K_SPACE)]:
-                self.player.jump()
-            
-            # Dimensionswechsel (mit Cooldown) - aktuelle Kontrollen verwenden
-            if keys[self.controls.get("dimension_change", pygame.K_d)] and self.dimension_cooldown <= 0:
-                self.switch_dimension()
-                self.dimension_cooldown = DIMENSION_CHANGE_COOLDOWN
+                elif not self.game_started or self.game_paused:
+                    continue
+                elif time.monotonic() < self._transition_until:
+                    # Während des Levelübergangs eingefroren: weder springen noch wechseln
+                    continue
+                elif event.key == self._k_jump:
+                    self.player.jump()
+                elif event.key == self._k_dim and self.dimension_cooldown <= 0:
+                    # Dimensionswechsel (mit Cooldown)
+                    self.switch_dimension()
+                    self.dimension_cooldown = DIMENSION_CHANGE_COOLDOWN
+    
+    def _apply_continuous_input(self):
+        """Wertet gehaltene Tasten (horizontale Bewegung) direkt vor der Simulation aus."""
+        keys = pygame.key.get_pressed()
+        
+        # Horizontale Bewegung - aktuelle Kontrollen verwenden
+        if keys[self._k_left]:
+            self.player.move_left()
+        elif keys[self._k_right]:
+            self.player.move_right()
+        else:
+            self.player.stop_horizontal_movement()
 
     def update(self, dt):
         """Aktualisiert den Spielzustand."""
@@ -263,39 +330,47 @@ class GameController:
             # Spielzeit erhöhen
             self.game_time += dt
             
-            # Zeitfaktor je nach Dimension
-            time_factor = 0.5 if self.current_dimension == 3 else 1.0  # Dimension 3 = Zeit-Paradox
+            # Uhr einmal pro Frame lesen und an den Spieler weiterreichen
+            now = time.monotonic()
+            
+            # Während des Level-Übergangs steht die Spielwelt still, das HUD läuft weiter
+            if now < self._transition_until:
+                self.hud.update(dt)
+                return
+            
+            # Häufig genutzte Attribute lokal binden; die Welt nicht, da sie im Fallback
+            # von handle_level_completion neu erzeugt werden kann
+            player = self.player
+            hud = self.hud
+            
+            # Gehaltene Tasten im selben Schritt wie die Simulation abfragen
+            self._apply_continuous_input()
             
-            # Zeitfaktor nach Schwierigkeitsgrad anpassen
-            if self.settings["difficulty"] == 0:  # Leicht
-                time_factor *= 0.9
-            elif self.settings["difficulty"] == 2:  # Schwer
-                time_factor *= 1.1
+            # Zeitfaktor aus Dimension und Schwierigkeitsgrad (nur bei Änderungen neu berechnet)
+            time_factor = self._time_factor
             
             # Spieler aktualisieren und Events empfangen
-            player_events = self.player.update(time_factor, self.world.platforms, self.world.portals, 
-                                             self.world.collectibles, self.world.enemies, self.current_dimension)
+            player_events = player.update(time_factor, self.world.get_platform_grid(self.current_dimension),
+                                        self.world.portals, 
+                                        self.world.collectibles, self.world.enemies, self.current_dimension,
+                                        now)
             
             # Sound-Events verarbeiten
             self.sound.handle_player_events(player_events)
             
             # Kollisionsprüfungen für Powerups
-            powerup_collected, powerup_type = self.world.check_player_powerup_collisions(self.player, self.current_dimension)
+            powerup_collected, powerup_type = self.world.check_player_powerup_collisions(player, self.current_dimension)
             
             if powerup_collected:
                 # Sound für Powerup-Einsammeln abspielen
                 self.sound.play_powerup_sound(powerup_type)
-                print(f"Powerup gesammelt: {powerup_type}")
+                if DEBUG_OUTPUT:
+                    print(f"Powerup gesammelt: {powerup_type}")
                 
                 # Benachrichtigung anzeigen
-                if powerup_type == "double_jump":
-                    self.hud.add_notification("Doppelsprung aktiviert!")
-                elif powerup_type == "speed_boost":
-                    self.hud.add_notification("Geschwindigkeitsboost aktiviert!")
-                elif powerup_type == "invincibility":
-                    self.hud.add_notification("Unverwundbarkeit aktiviert!")
-                elif powerup_type == "extra_life":
-                    self.hud.add_notification("Extra-Leben erhalten!")
+                message = self._POWERUP_MESSAGES.get(powerup_type)
+                if message:
+                    hud.add_notification(message)
                 
                 # Punkte für Powerup
                 self.score += 25
@@ -303,21 +378,23 @@ class GameController:
             # Benachrichtigungen für Events
             if player_events.get("collect", False):
                 self.score += COLLECTIBLE_SCORE * (self.current_level + 1)  # Höhere Level geben mehr Punkte
-                self.hud.add_notification(f"+{COLLECTIBLE_SCORE * (self.current_level + 1)} Punkte")
+                hud.add_notification(f"+{COLLECTIBLE_SCORE * (self.current_level + 1)} Punkte")
                 
                 # Zufällig Powerups spawnen, wenn Sammelobjekte eingesammelt werden
                 if random.random() < 0.15:  # 15% Chance für ein Powerup
-                    self.world.spawn_powerup(self.player.x + random.randint(-200, 200),
-                                           self.player.y - random.randint(100, 300))
+                    self.world.spawn_powerup(player.x + random.randint(-200, 200),
+                                           player.y - random.randint(100, 300))
                 
             if player_events.get("enemy_death", False):
+                # Besiegte Gegner aus der Welt nehmen, statt sie in jeder Schleife zu überspringen
+                self.world.remove_dead_enemies()
                 self.score += 50 * (self.current_level + 1)
-                self.hud.add_notification(f"Gegner besiegt! +{50 * (self.current_level + 1)} Punkte")
+                hud.add_notification(f"Gegner besiegt! +{50 * (self.current_level + 1)} Punkte")
                 
                 # Größere Chance auf Powerups beim Gegner-Tod
                 if random.random() < 0.3:  # 30% Chance für ein Powerup
-                    self.world.spawn_powerup(self.player.x + random.randint(-100, 100),
-                                           self.player.y - random.randint(50, 150))
+                    self.world.spawn_powerup(player.x + random.randint(-100, 100),
+                                           player.y - random.randint(50, 150))
                 
             # Level abgeschlossen
             if player_events.get("level_complete", False):
@@ -325,16 +402,16 @@ class GameController:
                 
             # Spieler gestorben
             if player_events.get("player_death", False):
-                if self.player.lives <= 0:
+                if player.lives <= 0:
                     self._game_over()
                 else:
                     self.reset_level()
             
             # Welt updaten
-            self.world.update(time_factor, self.player.x, self.player.y, self.current_dimension)
+            self.world.update(time_factor, player.x, player.y, self.current_dimension)
             
             # HUD aktualisieren
-            self.hud.update(dt)
+            hud.update(dt)
             
     def handle_level_completion(self):
         """Behandelt den Abschluss eines Levels und lädt das nächste Level."""
@@ -346,37 +423,26 @@ class GameController:
             self.hud.add_notification(f"Level {self.current_level} erreicht!")
             
             # Debug-Info vor der Generierung
-            print(f"[DEBUG] Level-Wechsel zu Level {self.current_level}")
-            print(f"[DEBUG] Alte Welt-Status - Plattformen: {len(self.world.platforms)}")
+            if DEBUG_OUTPUT:
+                print(f"[DEBUG] Level-Wechsel zu Level {self.current_level}")
+                print(f"[DEBUG] Alte Welt-Status - Plattformen: {len(self.world.platforms)}")
             
             # Soundeffekt für Level-Aufstieg abspielen
             self.sound.play_sound("level_up")
             
-            # KRITISCHE STELLE: Neu-Erstellung der Welt mit klarer Trennung
-            # Alte Welt komplett verwerfen
-            del self.world
-            
-            # Kurze Pause für GC
-            pygame.time.delay(100)
-            
-            # Neue Welt-Instanz erstellen
-            self.world = World()
-            
-            # Level mit erhöhter Levelnummer generieren
-            print(f"[DEBUG] Neue Welt generiert, generiere Level {self.current_level}")
-            self.world.generate_level(self.current_level)
+            # Bestehende Welt mit dem Level der erhöhten Levelnummer neu befüllen
+            self.world.reset(self.current_level)
             
             # Validieren, dass Objekte tatsächlich generiert wurden
-            print(f"[DEBUG] Neue Welt-Status - Plattformen: {len(self.world.platforms)}")
+            if DEBUG_OUTPUT:
+                print(f"[DEBUG] Neue Welt-Status - Plattformen: {len(self.world.platforms)}")
             
             # Spieler auf Startposition des neuen Levels setzen
             self.player.reset(100, 300)
             
-            # Kurze Freeze-Zeit zur Anzeige des Level-Übergangs
-            pygame.time.delay(500)
-            
-            # Nach Verzögerung erneut Plattformen prüfen (Konsistenzprüfung)
-            print(f"[DEBUG] Nach Verzögerung - Plattformen: {len(self.world.platforms)}")
+            # Kurze Freeze-Zeit zur Anzeige des Level-Übergangs, ohne die Hauptschleife zu blockieren
+            # (enthält auch die früher blockierende Pause beim Betreten des Portals)
+            self._transition_until = time.monotonic() + 0.8
         except Exception as e:
             print(f"[FEHLER] Beim Laden des Levels {self.current_level}: {str(e)}")
             # Ausnahmen-Stack ausgeben für bessere Fehleranalyse
@@ -387,17 +453,15 @@ class GameController:
             self.current_level -= 1
             
             try:
-                # Komplett neue Welt erstellen
-                del self.world
-                self.world = World()
-                self.world.generate_level(self.current_level)
+                # Welt mit dem vorherigen Level neu befüllen
+                self.world.reset(self.current_level)
                 self.player.reset(100, 300)
                 self.hud.add_notification("FEHLER: Zurück zum vorherigen Level")
             except Exception as fallback_e:
                 # Kritischer Fehler, wenn sogar das Fallback fehlschlägt
                 print(f"[KRITISCH] Fallback fehlgeschlagen: {str(fallback_e)}")
                 traceback.print_exc()
-                # Versuche, zum ersten Level zurückzukehren
+                # Versuche, mit einer komplett neuen Welt zum ersten Level zurückzukehren
                 self.current_level = 0
                 self.world = World()
                 self.world.generate_level(0)
@@ -407,16 +471,14 @@ class GameController:
         """Wechselt die aktuelle Dimension."""
         new_dimension = (self.current_dimension % MAX_DIMENSIONS) + 1
         self.current_dimension = new_dimension
+        self._refresh_time_factor()
         self.sound.handle_dimension_change(new_dimension)
         self.hud.add_notification(f"Dimension {new_dimension} aktiviert!")
         
     def reset_level(self):
         """Setzt das aktuelle Level zurück."""
-        # Welt vollständig neu initialisieren
-        self.world = World()  # Neue Welt-Instanz erstellen
-        
-        # Level mit aktueller Levelnummer generieren
-        self.world.generate_level(self.current_level)
+        # Welt mit der aktuellen Levelnummer neu befüllen
+        self.world.reset(self.current_level)
         
         # Spieler zurücksetzen
         self.player.reset(100, 300)
@@ -425,7 +487,8 @@ class GameController:
         self.hud.add_notification("Level neu gestartet!")
         
         # Debug-Information
-        print(f"Level {self.current_level} zurückgesetzt. Plattformen: {len(self.world.platforms)}")
+        if DEBUG_OUTPUT:
+            print(f"Level {self.current_level} zurückgesetzt. Plattformen: {len(self.world.platforms)}")
         
     def render(self):
         """Zeichnet den aktuellen Spielzustand."""
@@ -440,6 +503,12 @@ class GameController:
             self.world.render(self.screen, self.current_dimension)
             self.player.render(self.screen)
             
+            # FPS-Wert gedrosselt abfragen
+            self._fps_counter += 1
+            if self._fps_counter >= 15:
+                self._fps_counter = 0
+                self._fps_display = int(self.clock.get_fps())
+            
             # UI-Komponenten zeichnen
             self.hud.render(
                 self.screen,
@@ -448,12 +517,12 @@ class GameController:
                 self.score,
                 self.current_dimension,
                 self.game_time,
-                int(self.clock.get_fps()),
-                self.settings.get("show_debug", False)
+                self._fps_display,
+                self._show_debug
             )
             
             # Minimap anzeigen, wenn aktiviert
-            if self.settings.get("show_minimap", True):
+            if self._show_minimap:
                 game_objects = self.world.get_all_objects()
                 self.minimap.render(
                     self.screen,
@@ -470,15 +539,23 @@ class GameController:
                 self.player.active_powerups
             )
         
-        # Bild anzeigen
-        pygame.display.flip()
+        # Bild anzeigen: ruhende Menüs aktualisieren nur ihre geänderten Bereiche
+        dirty_rects = None
+        if self.active_menu is self._presented_menu and self.active_menu:
+            dirty_rects = self.active_menu.get_dirty_rects()
+        
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+        self._presented_menu = self.active_menu
     
     def run(self):
         """Startet die Hauptspielschleife."""
         try:
             while self.running:
                 # Delta-Zeit für gleichmäßige Bewegungen
-                dt = self.clock.tick(TARGET_FPS) / 1000.0
+                dt = self._tick(TARGET_FPS) / 1000.0
                 
                 # Eingabebehandlung
                 self.handle_events()
@@ -490,13 +567,9 @@ class GameController:
                 self.render()
                 
                 # Performance tracken
-                current_time = time.time()
-                frame_time = current_time - self.last_frame_time
+                current_time = time.monotonic()
+                self.frame_times.append(current_time - self.last_frame_time)
                 self.last_frame_time = current_time
-                
-                self.frame_times.append(frame_time)
-                if len(self.frame_times) > self.max_frame_times:
-                    self.frame_times.pop(0)
         finally:
             # Aufräumen bei Spielende oder Ausnahmen
             self.sound.cleanup()
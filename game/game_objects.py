@@ -3,21 +3,46 @@ import random
 import math
 from typing import List, Dict, Tuple, Optional, Set, Union, Any
 from game.constants import *
-from game.utils import draw_with_dimension_effect, draw_rounded_rect
+import numpy as np
+from game.utils import draw_with_dimension_effect, draw_rounded_rect, dimension_color
+
+# Zeichenfunktionen einmalig binden, statt sie bei jedem Aufruf über pygame.draw nachzuschlagen
+_draw_circle = pygame.draw.circle
+_draw_ellipse = pygame.draw.ellipse
+_draw_polygon = pygame.draw.polygon
+_draw_rect = pygame.draw.rect
+_Rect = pygame.Rect
+
+def _channel_permutations(color: Tuple[int, int, int]) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Liefert die Farbvarianten für alle MAX_DIMENSIONS Dimensionen (Index = Dimension - 1):
+    Normal, Spiegel, Zeit; die Quantendimension verwendet dieselbe Variante wie die Zeitdimension.
+    """
+    time_variant = (color[2], color[0], color[1])
+    return (color, (color[0], color[2], color[1]), time_variant, time_variant)
 
 class GameObject:
     """Basisklasse für alle Spielobjekte."""
-    __slots__ = ('x', 'y', 'width', 'height')
+    __slots__ = ('x', 'y', 'width', 'height', '_rect', '_half_w', '_half_h')
     
     def __init__(self, x: float, y: float, width: float, height: float):
         self.x = x
         self.y = y
         self.width = width
         self.height = height
+        # Halbe Abmessungen für Mittelpunktberechnungen (Größe ändert sich nach dem Erzeugen nicht)
+        self._half_w = width // 2
+        self._half_h = height // 2
+        self._rect = _Rect(x, y, width, height)
     
     def get_rect(self) -> pygame.Rect:
-        """Gibt das Rechteck des Objekts zurück."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """
+        Gibt das Rechteck des Objekts zurück.
+        Das Rect wird wiederverwendet und beim nächsten Aufruf überschrieben; zum Aufbewahren kopieren.
+        """
+        rect = self._rect
+        rect.update(self.x, self.y, self.width, self.height)
+        return rect
     
     def update(self, dt: float) -> None:
         """Aktualisiert den Zustand des Objekts."""
@@ -39,11 +64,57 @@ class Platform(GameObject):
         # Nur zeichnen, wenn in aktueller Dimension sichtbar
         if self.dimension_visible == -1 or self.dimension_visible == current_dimension:
             draw_with_dimension_effect(surface, self.get_rect(), self.color, current_dimension)
+
+def render_platforms(platforms: List[Platform], surface: pygame.Surface, current_dimension: int,
+                     camera_x: int, camera_y: int) -> None:
+    """
+    Zeichnet die Plattformen im Kamerabereich gesammelt, gruppiert nach Farbe, statt jede
+    Plattform einzeln über Platform.render. platforms muss bereits auf die in
+    current_dimension sichtbaren Plattformen gefiltert sein (siehe World.get_platforms).
+    """
+    rects_by_color = {}
+    for platform in platforms:
+        screen_x = platform.x - camera_x
+        screen_y = platform.y - camera_y
+        if screen_x + platform.width < 0 or screen_x > SCREEN_WIDTH or \
+           screen_y + platform.height < 0 or screen_y > SCREEN_HEIGHT:
+            continue
+        
+        rect = _Rect(screen_x, screen_y, platform.width, platform.height)
+        rects = rects_by_color.get(platform.color)
+        if rects is None:
+            rects_by_color[platform.color] = [rect]
+        else:
+            rects.append(rect)
+    
+    if not rects_by_color:
+        return
+    
+    fill = surface.fill
+    for color, rects in rects_by_color.items():
+        tinted = dimension_color(color, current_dimension)
+        for rect in rects:
+            fill(tinted, rect)
+    
+    if current_dimension == DIMENSION_TIME_SLOW:
+        # Zeiteffekt-Partikel (drei pro Plattform) mit einem einzigen Zufallsaufruf bestimmen
+        bounds = np.array([(r.x, r.y, r.right, r.bottom) for rects in rects_by_color.values() for r in rects])
+        positions = np.random.randint(
+            low=bounds[:, np.newaxis, :2],
+            high=bounds[:, np.newaxis, 2:],
+            size=(len(bounds), 3, 2)
+        )
+        circle = _draw_circle
+        for x, y in positions.reshape(-1, 2).tolist():
+            circle(surface, (200, 200, 255), (x, y), 2)
         
 class Enemy(GameObject):
     __slots__ = ('color', 'patrol_left', 'patrol_right', 'speed', 'direction', 
                  'is_dead', 'animation_frame', 'frame_timer')
     
+    # Augenfarbe je Dimension (Index = Dimension - 1); Zeit- und Quantendimension teilen sich eine
+    _EYE_COLORS = (WHITE, (200, 200, 100), (150, 150, 200), (150, 150, 200))
+    
     def __init__(self, x: float, y: float, patrol_left: float, patrol_right: float):
         super().__init__(x, y, 40, 40)
         self.color = ENEMY_COLOR
@@ -59,10 +130,8 @@ class Enemy(GameObject):
         if self.is_dead:
             return
             
-        # Zeitfaktor für konsistente Bewegung unabhängig von FPS
-        time_factor = dt * 60
-            
-        self.x += self.speed * self.direction * time_factor / 60.0
+        # Bewegung proportional zur verstrichenen Zeit, unabhängig von FPS
+        self.x += self.speed * self.direction * dt
         
         if self.x <= self.patrol_left:
             self.x = self.patrol_left
@@ -71,7 +140,7 @@ class Enemy(GameObject):
             self.x = self.patrol_right - self.width
             self.direction = -1
             
-        self.frame_timer += time_factor / 60.0
+        self.frame_timer += dt
         if self.frame_timer >= 10:
             self.animation_frame = (self.animation_frame + 1) % 2
             self.frame_timer = 0
@@ -90,24 +159,59 @@ class Enemy(GameObject):
         eye_offset = 10 if self.direction > 0 else -10
         eye_x = self.x + 10 if self.direction < 0 else self.x + 30
         
-        eye_color = WHITE if current_dimension == DIMENSION_NORMAL else \
-                   (200, 200, 100) if current_dimension == DIMENSION_MIRROR else \
-                   (150, 150, 200)
+        eye_color = self._EYE_COLORS[current_dimension - DIMENSION_NORMAL]
         
         # Koordinaten zu Ganzzahlen machen, um Fehler zu vermeiden
         eye_x_int = int(eye_x)
         eye_y_int = int(self.y + 15)
         
         # Stelle sicher, dass die Position als Tupel (int, int) übergeben wird
-        pygame.draw.circle(surface, eye_color, (eye_x_int, eye_y_int), 8)
-        pygame.draw.circle(surface, BLACK, (eye_x_int + eye_offset // 2, eye_y_int), 4)
+        _draw_circle(surface, eye_color, (eye_x_int, eye_y_int), 8)
+        _draw_circle(surface, BLACK, (eye_x_int + eye_offset // 2, eye_y_int), 4)
+
+def render_enemies(enemies: List[Enemy], surface: pygame.Surface, current_dimension: int,
+                   camera_x: int, camera_y: int) -> None:
+    """
+    Zeichnet alle lebenden Gegner im Kamerabereich in einer Schleife mit lokal gebundenen
+    Zeichenfunktionen, ohne ihre Positionen für die Kamera zu verschieben.
+    """
+    draw_body = draw_with_dimension_effect
+    circle = _draw_circle
+    Rect = _Rect
+    eye_color = Enemy._EYE_COLORS[current_dimension - DIMENSION_NORMAL]
+    
+    for enemy in enemies:
+        if enemy.is_dead:
+            continue
+        
+        screen_x = enemy.x - camera_x
+        screen_y = enemy.y - camera_y
+        width = enemy.width
+        height = enemy.height
+        if screen_x + width < 0 or screen_x > SCREEN_WIDTH or \
+           screen_y + height < 0 or screen_y > SCREEN_HEIGHT:
+            continue
+        
+        draw_body(surface, Rect(screen_x, screen_y, width, height), enemy.color, current_dimension)
+        
+        # Augen in Blickrichtung
+        if enemy.direction > 0:
+            eye_x = int(screen_x + 30)
+            pupil_x = eye_x + 5
+        else:
+            eye_x = int(screen_x + 10)
+            pupil_x = eye_x - 5
+        eye_y = int(screen_y + 15)
+        circle(surface, eye_color, (eye_x, eye_y), 8)
+        circle(surface, BLACK, (pupil_x, eye_y), 4)
 
 class Collectible(GameObject):
-    __slots__ = ('color', 'collected', 'animation_offset', 'animation_direction')
+    __slots__ = ('color', 'collected', 'animation_offset', 'animation_direction', '_dim_colors')
     
     def __init__(self, x: float, y: float):
         super().__init__(x, y, 20, 20)
         self.color = COLLECTIBLE_COLOR
+        self._dim_colors = _channel_permutations(self.color)
         self.collected = False
         self.animation_offset = 0
         self.animation_direction = 1
@@ -117,7 +221,7 @@ class Collectible(GameObject):
             return
             
         # Animationsgeschwindigkeit an delta time anpassen
-        anim_speed = 0.2 * dt * 60 / 60.0
+        anim_speed = 0.2 * dt
             
         self.animation_offset += anim_speed * self.animation_direction
         
@@ -130,111 +234,142 @@ class Collectible(GameObject):
         if self.collected:
             return
             
-        # Basis-Collectible zeichnen
-        collectible_rect = pygame.Rect(
-            self.x, 
-            self.y + self.animation_offset, 
-            self.width, 
-            self.height
-        )
-        
-        # Dimension-spezifische Farben
-        if current_dimension == DIMENSION_NORMAL:
-            color = self.color
-        elif current_dimension == DIMENSION_MIRROR:
-            color = (self.color[0], self.color[2], self.color[1])
-        else:
-            color = (self.color[2], self.color[0], self.color[1])
+        # Dimension-spezifische Farbe (beim Erzeugen vorberechnet)
+        color = self._dim_colors[current_dimension - DIMENSION_NORMAL]
+        x = self.x
+        y = self.y
+        animation_offset = self.animation_offset
             
         # Center-Koordinaten als Tupel mit ganzen Zahlen (int, int)
-        center_pos = (
-            int(self.x + self.width // 2), 
-            int(self.y + self.height // 2 + self.animation_offset)
-        )
-        pygame.draw.circle(
-            surface, 
-            color, 
-            center_pos, 
-            self.width // 2
-        )
+        center_pos = (int(x + self._half_w), int(y + self._half_h + animation_offset))
+        _draw_circle(surface, color, center_pos, self._half_w)
         
         # Glanz-Effekt
         highlight_pos = (
-            int(self.x + self.width * 0.7),
-            int(self.y + self.height * 0.3 + self.animation_offset)
+            int(x + self.width * 0.7),
+            int(y + self.height * 0.3 + animation_offset)
         )
-        pygame.draw.circle(surface, WHITE, highlight_pos, self.width // 6)
+        _draw_circle(surface, WHITE, highlight_pos, self.width // 6)
+
+def render_collectibles(collectibles: List[Collectible], surface: pygame.Surface, current_dimension: int,
+                        camera_x: int, camera_y: int) -> None:
+    """
+    Zeichnet alle nicht eingesammelten Sammelobjekte im Kamerabereich in einer Schleife mit
+    lokal gebundenen Zeichenfunktionen, ohne ihre Positionen für die Kamera zu verschieben.
+    """
+    circle = _draw_circle
+    dim_index = current_dimension - DIMENSION_NORMAL
+    
+    for collectible in collectibles:
+        if collectible.collected:
+            continue
+        
+        x = collectible.x - camera_x
+        y = collectible.y - camera_y
+        width = collectible.width
+        height = collectible.height
+        if x + width < 0 or x > SCREEN_WIDTH or y + height < 0 or y > SCREEN_HEIGHT:
+            continue
+        
+        animation_offset = collectible.animation_offset
+        half_w = collectible._half_w
+        circle(surface, collectible._dim_colors[dim_index],
+               (int(x + half_w), int(y + collectible._half_h + animation_offset)), half_w)
+        
+        # Glanz-Effekt
+        circle(surface, WHITE, (int(x + width * 0.7), int(y + height * 0.3 + animation_offset)),
+               width // 6)
 
 class Portal(GameObject):
-    __slots__ = ('animation_frame', 'portal_color')
+    __slots__ = ('_anim_millidegrees', 'portal_color', '_dim_colors')
+    
+    # Wellenintensität 0.5 + 0.5 * sin(Winkel) für jeden ganzen Grad, einmalig berechnet
+    _WAVE_INTENSITY = tuple(0.5 + 0.5 * math.sin(math.radians(angle)) for angle in range(360))
+    # Phasenversatz der acht Wellen in Grad
+    _WAVE_OFFSETS = tuple(i * 45 for i in range(8))
     
     def __init__(self, x: float, y: float):
         super().__init__(x, y, 40, 60)
-        self.animation_frame = 0
+        self._anim_millidegrees = 0  # Animationsphase als Ganzzahl in tausendstel Grad
         self.portal_color = PORTAL_COLOR
+        self._dim_colors = _channel_permutations(self.portal_color)
         
     def update(self, dt: float) -> None:
-        # Animation aktualisieren
-        self.animation_frame = (self.animation_frame + dt * 5) % 360
+        # Animation aktualisieren (5 Grad pro Frame, skaliert mit time_factor; ganzzahlig ohne Rundungsdrift)
+        self._anim_millidegrees = (self._anim_millidegrees + round(dt * 5000)) % 360000
         
     def render(self, surface: pygame.Surface, current_dimension: int) -> None:
         # Portal-Basis
         portal_rect = self.get_rect()
         
-        # Dimension-spezifische Farben
-        if current_dimension == DIMENSION_NORMAL:
-            portal_base_color = self.portal_color
-        elif current_dimension == DIMENSION_MIRROR:
-            portal_base_color = (self.portal_color[0], 
-                                self.portal_color[2], 
-                                self.portal_color[1])
-        else:
-            portal_base_color = (self.portal_color[2], 
-                                self.portal_color[0], 
-                                self.portal_color[1])
+        # Dimension-spezifische Farbe (beim Erzeugen vorberechnet)
+        portal_base_color = self._dim_colors[current_dimension - DIMENSION_NORMAL]
         
         # Animierte Wellen
-        num_waves = 8
-        max_radius = max(self.width, self.height) // 2 + 5
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
+        max_radius = max(self._half_w, self._half_h) + 5
+        center_x = self.x + self._half_w
+        center_y = self.y + self._half_h
         
         # Portalbasis zeichnen
-        pygame.draw.ellipse(surface, portal_base_color, portal_rect)
+        _draw_ellipse(surface, portal_base_color, portal_rect)
         
-        # Wellenmuster zeichnen
-        for i in range(num_waves):
-            wave_offset = (self.animation_frame + i * 45) % 360
-            wave_radius = int(max_radius * (0.5 + 0.5 * math.sin(math.radians(wave_offset))))
+        # Wellenmuster zeichnen (Intensität liegt in [0, 1], Radius und Farbe sind damit immer gültig)
+        frame = self._anim_millidegrees // 1000
+        center_pos = (int(center_x), int(center_y))
+        circle = _draw_circle
+        for offset in self._WAVE_OFFSETS:
+            wave_intensity = self._WAVE_INTENSITY[(frame + offset) % 360]
+            wave_radius = int(max_radius * wave_intensity)
             
             # Farbe mit Dimension und Animation anpassen
-            wave_intensity = 0.5 + 0.5 * math.sin(math.radians(wave_offset))
             wave_color = (
                 min(255, int(portal_base_color[0] * wave_intensity + 50)),
                 min(255, int(portal_base_color[1] * wave_intensity + 50)),
                 min(255, int(portal_base_color[2] * wave_intensity + 50))
             )
             
-            # Stelle sicher, dass das center-Argument ein Paar von Python-int-Werten ist
-            center_pos = (int(center_x), int(center_y))
-            
-            try:
-                pygame.draw.circle(
-                    surface, 
-                    wave_color, 
-                    center_pos, 
-                    wave_radius, 
-                    2
-                )
-            except Exception:
-                # Bei Fehler einfach überspringen
-                pass
+            circle(surface, wave_color, center_pos, wave_radius, 2)
+
+class PowerupType:
+    """Unveränderliche Eigenschaften eines Powerup-Typs, von allen Powerups dieses Typs geteilt."""
+    __slots__ = ('duration', 'effect_strength', 'display_name', 'description', 'color')
+    
+    def __init__(self, duration: float, effect_strength: float, display_name: str,
+                 description: str, color: Tuple[int, int, int]):
+        self.duration = duration  # Sekunden
+        self.effect_strength = effect_strength  # Multiplikator
+        self.display_name = display_name
+        self.description = description
+        self.color = color
 
 class Powerup(GameObject):
-    __slots__ = ('powerup_type', 'duration', 'effect_strength', 'display_name', 
-                 'description', 'color', 'animation_offset', 'animation_direction', 
+    __slots__ = ('powerup_type', 'type_info', 'animation_offset', 'animation_direction', 
                  'collected', 'dimension_visible')
     
+    # Selten benötigte Typ-Eigenschaften liegen nicht im Objekt, sondern einmal pro Typ hier
+    _TYPES: Dict[str, PowerupType] = {
+        "speed": PowerupType(10.0, 1.5, "Geschwindigkeit", "Erhöht die Geschwindigkeit", (0, 200, 200)),
+        "jump": PowerupType(15.0, 1.3, "Sprungkraft", "Erhöht die Sprungkraft", (200, 100, 200)),
+        "invincibility": PowerupType(5.0, 1.0, "Unverwundbarkeit", "Macht unverwundbar", (255, 215, 0)),
+        "gravity": PowerupType(8.0, 0.7, "Schwerkraft", "Reduziert die Schwerkraft", (100, 200, 100)),
+    }
+    # Standardwerte für unbekannte Typen
+    _UNKNOWN_TYPE = PowerupType(10.0, 1.0, "Unbekannt", "???", (150, 150, 150))
+    
+    # Eckpunkte des Sterns (Unverwundbarkeit) für Radius 1: abwechselnd Spitze und innerer Punkt
+    # (gerundet, damit Rundungsrauschen um 0 den Stern nicht asymmetrisch macht)
+    _STAR_UNIT = tuple(
+        (round(scale * math.cos(angle), 9), round(scale * math.sin(angle), 9))
+        for i in range(5)
+        for scale, angle in ((1.0, math.pi / 2 + 2 * math.pi * i / 5),
+                             (0.4, math.pi / 2 + 2 * math.pi * (i + 0.5) / 5))
+    )
+    
+    # Vorgezeichnete Formen je Powerup-Typ (beim ersten Zeichnen erzeugt)
+    _TEMPLATES: Dict[str, pygame.Surface] = {}
+    # Transparenter Rand, damit Spitzen auf der Außenkante nicht abgeschnitten werden
+    _TEMPLATE_PADDING = 1
+    
     def __init__(self, x: float, y: float, powerup_type: str, dimension: int = -1):
         super().__init__(x, y, 30, 30)
         self.powerup_type = powerup_type
@@ -248,44 +383,34 @@ class Powerup(GameObject):
     
     def setup_properties(self) -> None:
         """Setzt die spezifischen Eigenschaften basierend auf dem Powerup-Typ."""
-        if self.powerup_type == "speed":
-            self.duration = 10.0  # Sekunden
-            self.effect_strength = 1.5  # Multiplikator
-            self.display_name = "Geschwindigkeit"
-            self.description = "Erhöht die Geschwindigkeit"
-            self.color = (0, 200, 200)
-        elif self.powerup_type == "jump":
-            self.duration = 15.0
-            self.effect_strength = 1.3
-            self.display_name = "Sprungkraft"
-            self.description = "Erhöht die Sprungkraft"
-            self.color = (200, 100, 200)
-        elif self.powerup_type == "invincibility":
-            self.duration = 5.0
-            self.effect_strength = 1.0
-            self.display_name = "Unverwundbarkeit"
-            self.description = "Macht unverwundbar"
-            self.color = (255, 215, 0)
-        elif self.powerup_type == "gravity":
-            self.duration = 8.0
-            self.effect_strength = 0.7
-            self.display_name = "Schwerkraft"
-            self.description = "Reduziert die Schwerkraft"
-            self.color = (100, 200, 100)
-        else:
-            # Standardwerte für unbekannte Typen
-            self.duration = 10.0
-            self.effect_strength = 1.0
-            self.display_name = "Unbekannt"
-            self.description = "???"
-            self.color = (150, 150, 150)
+        self.type_info = self._TYPES.get(self.powerup_type, self._UNKNOWN_TYPE)
+    
+    @property
+    def duration(self) -> float:
+        return self.type_info.duration
+    
+    @property
+    def effect_strength(self) -> float:
+        return self.type_info.effect_strength
+    
+    @property
+    def display_name(self) -> str:
+        return self.type_info.display_name
+    
+    @property
+    def description(self) -> str:
+        return self.type_info.description
+    
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        return self.type_info.color
     
     def update(self, dt: float) -> None:
         if self.collected:
             return
             
         # Animation mit delta time aktualisieren
-        anim_speed = 0.3 * dt * 60 / 60.0
+        anim_speed = 0.3 * dt
         self.animation_offset += anim_speed * self.animation_direction
         
         if self.animation_offset > 5:
@@ -296,98 +421,70 @@ class Powerup(GameObject):
     def render(self, surface: pygame.Surface, current_dimension: int) -> None:
         if self.collected:
             return
+        
+        # Die Form hängt nur vom Typ ab und wird daher einmalig vorgezeichnet und nur noch geblittet
+        template = self._TEMPLATES.get(self.powerup_type)
+        if template is None:
+            template = self._create_template()
+            self._TEMPLATES[self.powerup_type] = template
             
+        surface.blit(template, (int(self.x) - self._TEMPLATE_PADDING,
+                                int(self.y + self.animation_offset) - self._TEMPLATE_PADDING))
+    
+    def _create_template(self) -> pygame.Surface:
+        """Zeichnet die typspezifische Form samt Glanzeffekt auf eine transparente Oberfläche."""
+        pad = self._TEMPLATE_PADDING
+        template = pygame.Surface((self.width + 2 * pad, self.height + 2 * pad), pygame.SRCALPHA)
+        
         # Basis-Form
-        powerup_rect = pygame.Rect(
-            self.x, 
-            self.y + self.animation_offset, 
-            self.width, 
-            self.height
-        )
+        powerup_rect = _Rect(pad, pad, self.width, self.height)
+        center_pos = (pad + self.width // 2, pad + self.height // 2)
         
         # Powerup-Typ-spezifische Formen zeichnen
         if self.powerup_type == "speed":
             # Pfeil nach oben
-            pygame.draw.polygon(
-                surface,
+            _draw_polygon(
+                template,
                 self.color,
                 [
-                    (self.x + self.width // 2, self.y + self.animation_offset),
-                    (self.x, self.y + self.height + self.animation_offset),
-                    (self.x + self.width, self.y + self.height + self.animation_offset)
+                    (pad + self.width // 2, pad),
+                    (pad, pad + self.height),
+                    (pad + self.width, pad + self.height)
                 ]
             )
         elif self.powerup_type == "jump":
             # Sprungfeder
-            pygame.draw.rect(surface, self.color, powerup_rect)
-            spring_base = pygame.Rect(
-                self.x + 5, 
-                self.y + self.height - 10 + self.animation_offset,
+            _draw_rect(template, self.color, powerup_rect)
+            spring_base = _Rect(
+                pad + 5, 
+                pad + self.height - 10,
                 self.width - 10, 
                 10
             )
-            pygame.draw.rect(surface, (100, 100, 100), spring_base)
+            _draw_rect(template, (100, 100, 100), spring_base)
         elif self.powerup_type == "invincibility":
             # Stern
-            center_x = self.x + self.width // 2
-            center_y = self.y + self.height // 2 + self.animation_offset
             radius = self.width // 2
-            points = []
+            points = [(int(center_pos[0] + radius * dx), int(center_pos[1] + radius * dy))
+                      for dx, dy in self._STAR_UNIT]
             
-            for i in range(5):
-                # Äußere Punkte (Sternspitzen)
-                angle_outer = math.pi / 2 + 2 * math.pi * i / 5
-                x_outer = float(center_x + radius * math.cos(angle_outer))
-                y_outer = float(center_y + radius * math.sin(angle_outer))
-                points.append((int(x_outer), int(y_outer)))
-                
-                # Innere Punkte
-                angle_inner = math.pi / 2 + 2 * math.pi * (i + 0.5) / 5
-                x_inner = float(center_x + radius * 0.4 * math.cos(angle_inner))
-                y_inner = float(center_y + radius * 0.4 * math.sin(angle_inner))
-                points.append((int(x_inner), int(y_inner)))
-                
-            pygame.draw.polygon(surface, self.color, points)
+            _draw_polygon(template, self.color, points)
         elif self.powerup_type == "gravity":
             # Schwerkraftsymbol (halbe Kugel mit Pfeilen)
-            # Center-Koordinaten als Tupel mit ganzen Zahlen (int, int)
-            center_pos = (
-                int(self.x + self.width // 2), 
-                int(self.y + self.height // 2 + self.animation_offset)
-            )
-            pygame.draw.circle(
-                surface, 
-                self.color, 
-                center_pos, 
-                self.width // 2
-            )
-            pygame.draw.rect(
-                surface,
+            _draw_circle(template, self.color, center_pos, self.width // 2)
+            _draw_rect(
+                template,
                 BLACK,
-                pygame.Rect(
-                    self.x, 
-                    self.y + self.height // 2 + self.animation_offset, 
-                    self.width, 
-                    self.height // 2
-                )
+                _Rect(pad, pad + self.height // 2, self.width, self.height // 2)
             )
         else:
             # Generischer Powerup (Kreis)
-            # Center-Koordinaten als Tupel mit ganzen Zahlen (int, int)
-            center_pos = (
-                int(self.x + self.width // 2), 
-                int(self.y + self.height // 2 + self.animation_offset)
-            )
-            pygame.draw.circle(
-                surface, 
-                self.color, 
-                center_pos, 
-                self.width // 2
-            )
+            _draw_circle(template, self.color, center_pos, self.width // 2)
             
         # Glanzeffekt für alle Powerups
         highlight_pos = (
-            int(self.x + self.width * 0.7),
-            int(self.y + self.height * 0.3 + self.animation_offset)
+            int(pad + self.width * 0.7),
+            int(pad + self.height * 0.3)
         )
-        pygame.draw.circle(surface, WHITE, highlight_pos, self.width // 8) 
\ No newline at end of file
+        _draw_circle(template, WHITE, highlight_pos, self.width // 8)
+        return template
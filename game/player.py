@@ -5,6 +5,7 @@ from typing import Dict, List, Tuple, Set, Any, Optional, Union
 from game.constants import *
 from game.utils import check_collision
 from game.game_objects import GameObject, Platform, Portal, Collectible, Enemy
+from game.spatial_hash import SpatialHash
 
 class Player:
     """Repräsentiert den Spieler-Charakter mit Bewegungs- und Kollisionslogik."""
@@ -15,7 +16,16 @@ class Player:
                 'frame_timer', 'last_x', 'step_distance', 'lives', 'score',
                 'active_powerups', 'powerup_timers', 'invincible_timer', 
                 'animation_state', 'collision_rects', 'last_safe_position',
-                'last_portal_time')
+                'last_portal_time', '_speed_mul', '_jump_mul', '_gravity_mul',
+                '_rect', '_landing_rect', '_leg_rect',
+                '_legs_run', '_legs_jump', '_legs_idle')
+    
+    # Effekt-Multiplikatoren der Powerups, die Bewegung oder Physik verändern
+    _POWERUP_MULTIPLIERS = {
+        "speed": 1.5,    # 50% schneller
+        "jump": 1.3,     # 30% höhere Sprünge
+        "gravity": 0.7   # 30% weniger Schwerkraft
+    }
     
     def __init__(self, x: float, y: float):
         """Initialisiert den Spieler an der gegebenen Position."""
@@ -61,6 +71,7 @@ class Player:
         self.active_powerups: Dict[str, bool] = {}
         self.powerup_timers: Dict[str, float] = {}
         self.invincible_timer = 0.0  # Nach Treffer kurz unverwundbar
+        self._refresh_powerup_multipliers()
         
         # Vorberechnete Kollisionsrechtecke für präzisere Kollisionserkennung
         self.collision_rects = {
@@ -70,25 +81,38 @@ class Player:
             "right": pygame.Rect(x + self.width - 5, y + 5, 5, self.height - 10)
         }
         
+        # Wiederverwendete Rechtecke für get_rect() und die Landeprüfung
+        self._rect = pygame.Rect(x, y, self.width, self.height)
+        self._landing_rect = pygame.Rect(x + 2, y + self.height - 6, self.width - 4, 10)
+        self._leg_rect = pygame.Rect(0, 0, 0, 0)
+        
+        # Beinrechtecke (x, y, Breite, Höhe) relativ zur Spielerposition, aus der Spielergröße
+        # berechnet; beim Laufen wechseln sich zwei Schrittstellungen ab
+        w, h = self.width, self.height
+        self._legs_run = (
+            ((10, h - 20, 10, 25), (w - 20, h - 20, 10, 15)),
+            ((10, h - 20, 10, 15), (w - 20, h - 20, 10, 25))
+        )
+        self._legs_jump = ((5, h - 15, 15, 15), (w - 20, h - 15, 15, 15))
+        self._legs_idle = ((10, h - 20, 10, 20), (w - 20, h - 20, 10, 20))
+        
         # Letzte sichere Position (für Fallback bei Kollisionsproblemen)
         self.last_safe_position = (x, y)
         
         # Portal-Cooldown
-        self.last_portal_time = time.time()
+        self.last_portal_time = time.monotonic()
         
     def move_left(self) -> None:
         """Bewegt den Spieler nach links."""
         # Geschwindigkeit durch Powerups anpassen
-        speed_multiplier = self.get_powerup_effect("speed", 1.0)
-        self.velocity_x = -PLAYER_SPEED * speed_multiplier
+        self.velocity_x = -PLAYER_SPEED * self._speed_mul
         self.direction = -1
         self.animation_state = "run"
         
     def move_right(self) -> None:
         """Bewegt den Spieler nach rechts."""
         # Geschwindigkeit durch Powerups anpassen
-        speed_multiplier = self.get_powerup_effect("speed", 1.0)
-        self.velocity_x = PLAYER_SPEED * speed_multiplier
+        self.velocity_x = PLAYER_SPEED * self._speed_mul
         self.direction = 1
         self.animation_state = "run"
         
@@ -102,7 +126,7 @@ class Player:
         """Führt einen Sprung aus, wenn möglich."""
         if self.jump_count < self.max_jumps:
             # Sprungkraft durch Powerups anpassen
-            jump_multiplier = self.get_powerup_effect("jump", 1.0)
+            jump_multiplier = self._jump_mul
             
             # Reduzierte Sprungkraft beim zweiten Sprung
             jump_strength = PLAYER_JUMP_STRENGTH
@@ -117,8 +141,13 @@ class Player:
         return False
     
     def get_rect(self) -> pygame.Rect:
-        """Gibt das Rechteck des Spielers zurück."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """
+        Gibt das Rechteck des Spielers zurück.
+        Das Rect wird wiederverwendet und beim nächsten Aufruf überschrieben; zum Aufbewahren kopieren.
+        """
+        rect = self._rect
+        rect.update(self.x, self.y, self.width, self.height)
+        return rect
     
     def add_powerup(self, powerup_type: str, duration: float) -> None:
         """Fügt ein Powerup hinzu und setzt dessen Timer."""
@@ -133,42 +162,51 @@ class Player:
         # Spezielle Powerup-Effekte anwenden
         if powerup_type == "jump":
             self.max_jumps = 3  # Dreifachsprung mit Sprung-Powerup
+        
+        self._refresh_powerup_multipliers()
     
     def get_powerup_effect(self, powerup_type: str, default_value: float = 1.0) -> float:
         """Gibt den Effekt-Multiplikator für ein bestimmtes Powerup zurück."""
-        if powerup_type not in self.active_powerups or not self.active_powerups[powerup_type]:
+        if not self.active_powerups.get(powerup_type, False):
             return default_value
-            
-        # Powerup-spezifische Effekte
-        if powerup_type == "speed":
-            return 1.5  # 50% schneller
-        elif powerup_type == "jump":
-            return 1.3  # 30% höhere Sprünge
-        elif powerup_type == "gravity":
-            return 0.7  # 30% weniger Schwerkraft
-        
-        return default_value
+        return self._POWERUP_MULTIPLIERS.get(powerup_type, default_value)
+    
+    def _refresh_powerup_multipliers(self) -> None:
+        """Berechnet die Multiplikatoren neu; nur nötig, wenn Powerups beginnen oder ablaufen."""
+        self._speed_mul = self.get_powerup_effect("speed")
+        self._jump_mul = self.get_powerup_effect("jump")
+        self._gravity_mul = self.get_powerup_effect("gravity")
     
     def update_powerups(self, dt: float) -> None:
         """Aktualisiert die Timer für alle aktiven Powerups."""
-        expired_powerups = []
+        timers = self.powerup_timers
         
-        for powerup_type, time_remaining in self.powerup_timers.items():
-            # Timer reduzieren
-            self.powerup_timers[powerup_type] -= dt
+        # Meistens ist kein Powerup aktiv
+        if timers:
+            expired_powerups = None
             
-            # Abgelaufene Powerups markieren
-            if self.powerup_timers[powerup_type] <= 0:
-                expired_powerups.append(powerup_type)
-        
-        # Abgelaufene Powerups entfernen
-        for powerup_type in expired_powerups:
-            self.active_powerups[powerup_type] = False
-            del self.powerup_timers[powerup_type]
+            for powerup_type, time_remaining in timers.items():
+                # Timer reduzieren
+                time_remaining -= dt
+                timers[powerup_type] = time_remaining
+                
+                # Abgelaufene Powerups markieren (Liste nur bei Bedarf anlegen)
+                if time_remaining <= 0:
+                    if expired_powerups is None:
+                        expired_powerups = []
+                    expired_powerups.append(powerup_type)
             
-            # Spezielle Powerup-Effekte zurücksetzen
-            if powerup_type == "jump":
-                self.max_jumps = 2  # Zurück zu Doppelsprung
+            # Abgelaufene Powerups entfernen
+            if expired_powerups is not None:
+                for powerup_type in expired_powerups:
+                    self.active_powerups[powerup_type] = False
+                    del timers[powerup_type]
+                    
+                    # Spezielle Powerup-Effekte zurücksetzen
+                    if powerup_type == "jump":
+                        self.max_jumps = 2  # Zurück zu Doppelsprung
+                
+                self._refresh_powerup_multipliers()
                 
         # Unverwundbarkeits-Timer aktualisieren
         if self.invincible_timer > 0:
@@ -205,9 +243,13 @@ class Player:
         self.collision_rects["right"].x = self.x + self.width - 5
         self.collision_rects["right"].y = self.y + 5
             
-    def update(self, dt: float, platforms: List[Platform], portals: List[Portal], 
-              collectibles: List[Collectible], enemies: List[Enemy], current_dimension: int = 1) -> Dict[str, Any]:
-        """Aktualisiert den Spielerzustand und prüft Kollisionen."""
+    def update(self, dt: float, platform_grid: SpatialHash, portals: List[Portal], 
+              collectibles: List[Collectible], enemies: List[Enemy], current_dimension: int = 1,
+              now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Aktualisiert den Spielerzustand und prüft Kollisionen.
+        now ist der aktuelle time.monotonic()-Wert; ohne Angabe wird die Uhr einmal selbst gelesen.
+        """
         # Event-Dictionary für Rückgabe
         events = {}
         
@@ -219,23 +261,31 @@ class Player:
         if self.on_ground:
             self.last_safe_position = (self.x, self.y)
             
-        # Bewegung anhand Delta-Zeit aktualisieren
+        # Bewegung anhand Delta-Zeit aktualisieren; der Zustand wird einmal in lokale
+        # Variablen geladen und am Ende gesammelt zurückgeschrieben
         # Powerup-Effekte berücksichtigen
-        gravity_multiplier = self.get_powerup_effect("gravity", 1.0)
+        gravity_multiplier = self._gravity_mul
         
         # Schwerkraft anwenden
-        self.velocity_y += GRAVITY * gravity_multiplier * dt
+        velocity_y = self.velocity_y + GRAVITY * gravity_multiplier * dt
         
         # Maximum-Fallgeschwindigkeit begrenzen
         max_fall_speed = MAX_FALL_SPEED * gravity_multiplier
-        self.velocity_y = min(self.velocity_y, max_fall_speed)
+        if velocity_y > max_fall_speed:
+            velocity_y = max_fall_speed
         
         # Position aktualisieren
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
+        x = self.x + self.velocity_x * dt
+        y = self.y + velocity_y * dt
         
-        # Spielbegrenzungen einhalten
-        self.x = max(0, min(self.x, LEVEL_WIDTH - self.width))
+        # Spielbegrenzungen einhalten (Vergleichskette statt max/min-Aufrufen, im Normalfall ein Test)
+        max_x = LEVEL_WIDTH - self.width
+        if not 0 <= x <= max_x:
+            x = 0 if x < 0 else max_x
+        
+        self.velocity_y = velocity_y
+        self.x = x
+        self.y = y
         
         # Animationszustand aktualisieren
         self._update_animation(dt)
@@ -244,7 +294,7 @@ class Player:
         self._update_collision_rects()
         
         # Kollisionen prüfen - aktuelle Dimension übergeben
-        self.check_platform_collisions(platforms, current_dimension)
+        self.check_platform_collisions(platform_grid)
         
         # Audio-Events (Schritte) erkennen
         step_threshold = 40  # Pixel Bewegung für ein Schrittgeräusch
@@ -272,15 +322,15 @@ class Player:
             
         # Kollisionen mit anderen Objekten prüfen
         # Portal-Kollision mit verbesserter Logik
-        if self._check_portal_collision(portals):
-            print("[DEBUG] Portal-Kollision erkannt! Level abgeschlossen.")
-            # Sicherstellen, dass wir ein eindeutiges Ereignis mit Verzögerung auslösen
+        if now is None:
+            now = time.monotonic()
+        if self._check_portal_collision(portals, now):
+            if DEBUG_OUTPUT:
+                print("[DEBUG] Portal-Kollision erkannt! Level abgeschlossen.")
+            # Die Pause beim Levelwechsel übernimmt der GameController, ohne die Schleife zu blockieren
             events["level_complete"] = True
             self.level_completed = True
             
-            # Kurze Verzögerung, um sicherzustellen, dass das Level vollständig geladen wird
-            time.sleep(0.3)
-            
         if self.check_collectible_collisions(collectibles):
             events["collect"] = True
             self.collected_item = True
@@ -310,25 +360,26 @@ class Player:
         """Gibt zurück, ob der Spieler aktuell unverwundbar ist."""
         return self.invincible_timer > 0 or self.active_powerups.get("invincibility", False)
         
-    def check_platform_collisions(self, platforms: List[Platform], current_dimension: int) -> None:
-        """Prüft und behandelt Kollisionen mit Plattformen."""
+    def check_platform_collisions(self, platform_grid: SpatialHash) -> None:
+        """
+        Prüft und behandelt Kollisionen mit Plattformen.
+        platform_grid enthält nur die in der aktuellen Dimension sichtbaren Plattformen.
+        """
         self.on_ground = False
         
         player_rect = self.get_rect()
         
         # Erweitere den bottom_rect für bessere Kollisionserkennung
-        bottom_rect = pygame.Rect(
+        bottom_rect = self._landing_rect
+        bottom_rect.update(
             self.x + 2,
             self.y + self.height - 6,
             self.width - 4,
             10  # Größerer Bereich für Kollisionserkennung
         )
         
-        for platform in platforms:
-            # Nur Kollisionen mit Plattformen überprüfen, die in der aktuellen Dimension sichtbar sind
-            if not (platform.dimension_visible == -1 or platform.dimension_visible == current_dimension):
-                continue
-                
+        # Nur Plattformen aus den Rasterzellen prüfen, die der Spieler überlappt
+        for platform in platform_grid.query(self.x, self.y, self.width, self.height):
             platform_rect = platform.get_rect()
             
             # Performante Vorprüfung
@@ -369,29 +420,30 @@ class Player:
                 self.x = platform_rect.x + platform_rect.width - 1  # -1 um Hängenbleiben zu vermeiden
                 self.velocity_x = 0
     
-    def _check_portal_collision(self, portals: List[Portal]) -> bool:
+    def _check_portal_collision(self, portals: List[Portal], now: float) -> bool:
         """
         Verbesserte Portalprüfung mit Cooldown und Robustheit.
         Verhindert mehrfache Portal-Kollisionen.
         """
-        player_rect = self.get_rect()
-        current_time = time.time()
-        
         # Nur prüfen, wenn Cooldown abgelaufen ist
-        if current_time - self.last_portal_time < 1.0:
+        if now - self.last_portal_time < PORTAL_COOLDOWN:
             return False
+        
+        player_rect = self.get_rect()
+        # Mittelpunkt des Spielers (robustere Kollisionserkennung)
+        player_center_x = self.x + self.width / 2
+        player_center_y = self.y + self.height / 2
             
         for portal in portals:
             portal_rect = portal.get_rect()
-            # Prüfen, ob der Mittelpunkt des Spielers im Portal ist (robustere Kollisionserkennung)
-            player_center_x = self.x + self.width / 2
-            player_center_y = self.y + self.height / 2
             
+            # Prüfen, ob der Mittelpunkt des Spielers im Portal ist oder sich die Rechtecke überlappen
             if (portal_rect.collidepoint(player_center_x, player_center_y) or
                 player_rect.colliderect(portal_rect)):
                 # Portal-Cooldown aktualisieren
-                self.last_portal_time = current_time
-                print(f"[DEBUG] Portal bei ({portal.x}, {portal.y}) betreten")
+                self.last_portal_time = now
+                if DEBUG_OUTPUT:
+                    print(f"[DEBUG] Portal bei ({portal.x}, {portal.y}) betreten")
                 return True
                 
         return False
@@ -410,7 +462,8 @@ class Player:
     
     def check_enemy_collisions(self, enemies: List[Enemy]) -> Optional[str]:
         """
-        Prüft Kollisionen mit Gegnern.
+        Prüft Kollisionen mit Gegnern; enemies enthält nur lebende Gegner
+        (siehe World.remove_dead_enemies).
         Rückgabewerte:
         - "player_death": Spieler wurde vom Gegner getroffen
         - "enemy_death": Spieler hat Gegner besiegt
@@ -420,9 +473,6 @@ class Player:
         bottom_rect = self.collision_rects["bottom"]
         
         for enemy in enemies:
-            if enemy.is_dead:
-                continue
-                
             enemy_rect = enemy.get_rect()
             
             if player_rect.colliderect(enemy_rect):
@@ -469,31 +519,22 @@ class Player:
         pygame.draw.circle(surface, WHITE, eye_pos, 8)
         pygame.draw.circle(surface, BLACK, eye_pupil_pos, 4)
         
-        # Beine/Animation basierend auf Bewegungszustand
+        # Beine/Animation basierend auf Bewegungszustand (vorberechnete Rechtecke)
         if self.animation_state == "run":
-            leg_offset = 5 if self.animation_frame % 2 == 0 else -5
-            pygame.draw.rect(surface, player_color, 
-                           (self.x + 10, self.y + self.height - 20, 
-                            10, 20 + leg_offset))
-            pygame.draw.rect(surface, player_color, 
-                           (self.x + self.width - 20, self.y + self.height - 20, 
-                            10, 20 - leg_offset))
+            legs = self._legs_run[self.animation_frame & 1]
         elif self.animation_state == "jump":
             # Beinhaltung beim Springen
-            pygame.draw.rect(surface, player_color, 
-                           (self.x + 5, self.y + self.height - 15, 
-                            15, 15))
-            pygame.draw.rect(surface, player_color, 
-                           (self.x + self.width - 20, self.y + self.height - 15, 
-                            15, 15))
+            legs = self._legs_jump
         else:
             # Normale Beine
-            pygame.draw.rect(surface, player_color, 
-                           (self.x + 10, self.y + self.height - 20, 
-                            10, 20))
-            pygame.draw.rect(surface, player_color, 
-                           (self.x + self.width - 20, self.y + self.height - 20, 
-                            10, 20))
+            legs = self._legs_idle
+        
+        x = self.x
+        y = self.y
+        leg_rect = self._leg_rect
+        for dx, dy, width, height in legs:
+            leg_rect.update(x + dx, y + dy, width, height)
+            pygame.draw.rect(surface, player_color, leg_rect)
             
     def get_status(self) -> Dict[str, Any]:
         """Gibt ein Dictionary mit dem aktuellen Spielerstatus zurück."""
@@ -503,7 +544,7 @@ class Player:
             "on_ground": self.on_ground,
             "jumps": self.jump_count,
             "lives": self.lives,
-            "active_powerups": list(filter(lambda x: self.active_powerups.get(x, False), self.active_powerups.keys())),
+            "active_powerups": [name for name, active in self.active_powerups.items() if active],
             "is_dead": self.is_dead,
             "invincible": self.is_invincible()
         } 
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Gleichmäßiges Raster (Spatial Hash) als Broad-Phase für Kollisionsabfragen gegen
+statische Objekte wie Plattformen.
+"""
+from typing import Dict, List, Tuple
+from game.game_objects import GameObject
+
+class SpatialHash:
+    """Ordnet Objekte allen Rasterzellen zu, die ihr Rechteck überdeckt."""
+    
+    __slots__ = ('cell_size', 'buckets', '_order')
+    
+    def __init__(self, cell_size: int = 128):
+        self.cell_size = cell_size
+        self.buckets: Dict[Tuple[int, int], List[GameObject]] = {}
+        # Einfügereihenfolge, damit Abfragen dieselbe Reihenfolge wie die Ursprungsliste liefern
+        self._order: Dict[int, int] = {}
+    
+    def insert(self, obj: GameObject) -> None:
+        """Fügt ein Objekt in alle Zellen ein, die sein Rechteck überlappt."""
+        self._order[id(obj)] = len(self._order)
+        cell = self.cell_size
+        buckets = self.buckets
+        for cx in range(int(obj.x // cell), int((obj.x + obj.width) // cell) + 1):
+            for cy in range(int(obj.y // cell), int((obj.y + obj.height) // cell) + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket is None:
+                    buckets[(cx, cy)] = [obj]
+                else:
+                    bucket.append(obj)
+    
+    def query(self, x: float, y: float, width: float, height: float) -> List[GameObject]:
+        """Liefert alle Objekte aus den Zellen, die das Rechteck überlappt, in Einfügereihenfolge."""
+        cell = self.cell_size
+        buckets = self.buckets
+        x0 = int(x // cell)
+        x1 = int((x + width) // cell)
+        y0 = int(y // cell)
+        y1 = int((y + height) // cell)
+        
+        # Häufigster Fall: das Rechteck liegt in einer einzigen Zelle
+        if x0 == x1 and y0 == y1:
+            return buckets.get((x0, y0), [])
+        
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket:
+                    for obj in bucket:
+                        found[id(obj)] = obj
+        
+        if len(found) < 2:
+            return list(found.values())
+        order = self._order
+        return sorted(found.values(), key=lambda obj: order[id(obj)])
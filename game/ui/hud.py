@@ -2,6 +2,7 @@
 Enthält die HUD-Klasse für die Spieloberfläche, die Spielerinformationen anzeigt.
 """
 import pygame
+import numpy as np
 from game.constants import *
 from typing import Dict, Any, Tuple, Optional, List
 import math
@@ -346,8 +347,17 @@ class MinimapWidget:
         self.minimap_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self.border_color = HUD_BORDER_COLOR
         self.background_color = (0, 0, 0, 150)  # Halbtransparent
+        
+        # Farben pro Objekttyp, Reihenfolge wie World.MINIMAP_OBJECT_TYPES
+        self.object_colors = [
+            (100, 100, 100),  # Plattform
+            (150, 50, 200),   # Portal
+            (50, 200, 50),    # Sammelobjekt
+            (200, 50, 50),    # Gegner
+            (200, 200, 50)    # Powerup
+        ]
     
-    def render(self, surface: pygame.Surface, game_objects: List[Dict], player_pos: Tuple[float, float], 
+    def render(self, surface: pygame.Surface, game_objects: Tuple[np.ndarray, np.ndarray], player_pos: Tuple[float, float], 
               level_width: float, level_height: float, hud_time_rect: Optional[pygame.Rect] = None) -> None:
         """Zeichnet die Minimap mit Spielobjekten."""
         # Leere Minimap erstellen
@@ -357,31 +367,16 @@ class MinimapWidget:
         scale_x = self.width / level_width
         scale_y = self.height / level_height
         
-        # Alle Objekte zeichnen
-        for obj in game_objects:
-            # Position und Größe berechnen
-            minimap_x = int(obj['x'] * scale_x)
-            minimap_y = int(obj['y'] * scale_y)
-            minimap_width = max(2, int(obj['width'] * scale_x))
-            minimap_height = max(2, int(obj['height'] * scale_y))
-            
-            # Verschiedene Objekttypen mit unterschiedlichen Farben darstellen
-            if obj['type'] == 'platform':
-                obj_color = (100, 100, 100)
-            elif obj['type'] == 'enemy':
-                obj_color = (200, 50, 50)
-            elif obj['type'] == 'collectible':
-                obj_color = (50, 200, 50)
-            elif obj['type'] == 'portal':
-                obj_color = (150, 50, 200)
-            elif obj['type'] == 'powerup':
-                obj_color = (200, 200, 50)
-            else:
-                obj_color = (150, 150, 150)
-            
-            # Objekt zeichnen
-            pygame.draw.rect(self.minimap_surface, obj_color, 
-                           (minimap_x, minimap_y, minimap_width, minimap_height))
+        # Positionen und Größen aller Objekte in einem Schritt skalieren (mindestens 2 Pixel groß)
+        boxes, kinds = game_objects
+        rects = (boxes * np.array([scale_x, scale_y, scale_x, scale_y], dtype=np.float32)).astype(np.int32)
+        np.maximum(rects[:, 2:], 2, out=rects[:, 2:])
+        
+        # Alle Objekte zeichnen, Farbe je nach Objekttyp
+        fill = self.minimap_surface.fill
+        object_colors = self.object_colors
+        for kind, rect in zip(kinds.tolist(), rects.tolist()):
+            fill(object_colors[kind], rect)
         
         # Spieler zeichnen (als kleiner blauer Punkt)
         player_minimap_x = int(player_pos[0] * scale_x)
@@ -114,6 +114,18 @@ class Menu:
                 return True
         return False
     
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Liefert die Bereiche, die sich seit dem letzten Frame geändert haben können,
+        oder None, wenn der ganze Bildschirm aktualisiert werden muss.
+        """
+        # Übergänge blenden den ganzen Bildschirm über
+        if self.transition_in < 1.0 or self.transitioning_to is not None:
+            return None
+        
+        # Sonst ändern sich nur die UI-Elemente (Hover-Rahmen ragt bis zu 2 Pixel heraus)
+        return [element.rect.inflate(8, 8) for element in self.ui_elements]
+    
     def update(self) -> None:
         """Aktualisiert den Zustand des Menüs."""
         # Mausposition abrufen
@@ -402,6 +414,10 @@ class SettingsMenu(Menu):
         if self.save_settings_callback:
             self.save_settings_callback(self.settings)
     
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Die Partikel wandern über den ganzen Bildschirm, daher immer vollständig aktualisieren."""
+        return None
+    
     def render(self, surface: pygame.Surface) -> None:
         """Zeichnet das Einstellungsmenü mit zusätzlichen Infos."""
         # Basis-Rendering (Hintergrund, Titel, etc.)
@@ -647,6 +663,10 @@ class ControlsMenu(Menu):
         # Standard-Ereignisverarbeitung für UI-Elemente
         return super().handle_event(event)
     
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Die Partikel wandern über den ganzen Bildschirm, daher immer vollständig aktualisieren."""
+        return None
+    
     def render(self, surface: pygame.Surface) -> None:
         """Zeichnet das Steuerungsmenü mit Beschriftungen."""
         # Klare den Bildschirm zuerst
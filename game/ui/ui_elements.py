@@ -307,7 +307,8 @@ class KeyBinding(UIElement):
             if self.rect.collidepoint(event.pos):
                 if self.on_click:
                     # Debug-Ausgabe zur Bestätigung des Klicks
-                    print(f"KeyBinding clicked: {pygame.key.name(self.key_code)}")
+                    if DEBUG_OUTPUT:
+                        print(f"KeyBinding clicked: {pygame.key.name(self.key_code)}")
                     self.on_click()
                 return True
         return False
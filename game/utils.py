@@ -73,26 +73,27 @@ def draw_rounded_rect(surface: pygame.Surface, rect: Union[pygame.Rect, Tuple[in
     pygame.draw.circle(surface, color, bottom_left, radius)
     pygame.draw.circle(surface, color, bottom_right, radius)
 
+def dimension_color(normal_color: Tuple[int, int, int], dimension: int) -> Tuple[int, int, int]:
+    """Liefert die dimensionsspezifisch angepasste Farbe."""
+    from game.constants import DIMENSION_MIRROR, DIMENSION_TIME_SLOW
+    
+    if dimension == DIMENSION_MIRROR:
+        # Invertierte Farbe für Spiegeldimension
+        return tuple(255 - c for c in normal_color)
+    if dimension == DIMENSION_TIME_SLOW:
+        # Abgedunkelte, aber blaustichige Farbe für Zeitdimension
+        return (normal_color[0] // 2, normal_color[1] // 2, normal_color[2])
+    return normal_color
+
 def draw_with_dimension_effect(surface: pygame.Surface, rect: pygame.Rect, 
                                normal_color: Tuple[int, int, int], dimension: int) -> None:
     """
     Zeichnet ein Objekt mit dimensionsspezifischen Effekten.
     Optimiert für weniger bedingte Anweisungen.
     """
-    from game.constants import DIMENSION_NORMAL, DIMENSION_MIRROR, DIMENSION_TIME_SLOW
+    from game.constants import DIMENSION_TIME_SLOW
     
-    # Dimensionsabhängige Farbanpassung (als Lookup statt bedingter Anweisungen)
-    if dimension == DIMENSION_NORMAL:
-        color = normal_color
-    elif dimension == DIMENSION_MIRROR:
-        # Invertierte Farbe für Spiegeldimension
-        color = tuple(255 - c for c in normal_color)
-    elif dimension == DIMENSION_TIME_SLOW:
-        # Abgedunkelte, aber blaustichige Farbe für Zeitdimension
-        color = (normal_color[0] // 2, normal_color[1] // 2, normal_color[2])
-    else:
-        # Fallback
-        color = normal_color
+    color = dimension_color(normal_color, dimension)
     
     # Rechteck zeichnen
     try:
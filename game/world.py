@@ -3,11 +3,15 @@ import random
 import numpy as np
 from typing import List, Dict, Tuple, Optional, Set, Union, Any
 from game.constants import *
-from game.game_objects import GameObject, Platform, Portal, Collectible, Enemy, Powerup
+from game.game_objects import GameObject, Platform, Portal, Collectible, Enemy, Powerup, render_platforms, render_enemies, render_collectibles
+from game.spatial_hash import SpatialHash
 
 class World:
     """Verwaltet alle Spielobjekte, Partikel und die Kamera in der Spielwelt."""
     
+    # Objekttypen, wie sie get_all_objects() für die Minimap indiziert
+    MINIMAP_OBJECT_TYPES = ("platform", "portal", "collectible", "enemy", "powerup")
+    
     def __init__(self):
         # Spielobjekte
         self.platforms: List[Platform] = []
@@ -16,6 +20,10 @@ class World:
         self.enemies: List[Enemy] = []
         self.powerups: List[Powerup] = []
         
+        # Sichtbare Plattformen und ihr Kollisionsraster je Dimension (bei Bedarf aufgebaut)
+        self._platforms_by_dimension: Dict[int, List[Platform]] = {}
+        self._platform_grids: Dict[int, SpatialHash] = {}
+        
         # Partikel
         self.background_particles: List[Dict[str, Any]] = []
         self.foreground_particles: np.ndarray = np.zeros((0, 7))  # x, y, größe, vx, vy, lebensdauer, farbe_index
@@ -88,7 +96,8 @@ class World:
         self._clear_level()
         
         # Debug-Info
-        print(f"[DEBUG] Generiere Level {level_number}...")
+        if DEBUG_OUTPUT:
+            print(f"[DEBUG] Generiere Level {level_number}...")
         
         # Level basierend auf der Nummer auswählen
         if level_number == 0:
@@ -102,7 +111,19 @@ class World:
             self._generate_random_level(level_number)
             
         # Debug-Info zur Validierung
-        self._debug_level_objects()
+        if DEBUG_OUTPUT:
+            self._debug_level_objects()
+        
+    def reset(self, level_number: int) -> None:
+        """Setzt die Welt zurück und generiert ein Level, ohne Listen und Partikel-Arrays neu anzulegen."""
+        # Kamera wie bei einer neuen Welt an den Ursprung setzen
+        self.camera_x = 0.0
+        self.camera_y = 0.0
+        self.camera_target_x = 0.0
+        self.camera_target_y = 0.0
+        
+        # Leert die Objektlisten und den Vordergrundpartikel-Pool
+        self.generate_level(level_number)
         
     def _debug_level_objects(self) -> None:
         """Gibt Debug-Informationen zu allen Levelobjekten aus."""
@@ -173,7 +194,8 @@ class World:
         
     def _generate_time_warp_level(self) -> None:
         """Generiert das Zeitdehnungs-Level mit einzigartigen Zeiteffekten."""
-        print("[DEBUG] Generiere Zeit-Level (Level 2)...")
+        if DEBUG_OUTPUT:
+            print("[DEBUG] Generiere Zeit-Level (Level 2)...")
         
         # Aktive Partikel zurücksetzen (für saubere Umgebung)
         self.active_particles = 0
@@ -189,7 +211,8 @@ class World:
         
         # Dritte Plattform (war problematisch)
         self.platforms.append(Platform(790, 410, 180, 20))
-        print("[DEBUG] Dritte Plattform erstellt: (790, 410)")
+        if DEBUG_OUTPUT:
+            print("[DEBUG] Dritte Plattform erstellt: (790, 410)")
         
         # Backup-Plattformen für bessere Spielbarkeit
         self.platforms.append(Platform(750, 450, 150, 20))
@@ -201,7 +224,8 @@ class World:
         self.platforms.append(Platform(200, 400, 150, 20))
         
         # Verifizierbarer Status nach Plattform-Erstellung
-        print(f"[DEBUG] Zeit-Level hat {len(self.platforms)} Plattformen erstellt")
+        if DEBUG_OUTPUT:
+            print(f"[DEBUG] Zeit-Level hat {len(self.platforms)} Plattformen erstellt")
         
         # Zeitabhängige Plattformen
         time_platform1 = Platform(500, 300, 150, 20)
@@ -231,15 +255,17 @@ class World:
         # Portal zum nächsten Level
         portal = Portal(900, 340)
         self.portals.append(portal)
-        print(f"[DEBUG] Portal erstellt bei (900, 340)")
+        if DEBUG_OUTPUT:
+            print(f"[DEBUG] Portal erstellt bei (900, 340)")
         
         # Powerup für zusätzlichen Anreiz
         self.powerups.append(Powerup(300, 370, "gravity"))
         
         # Final-Prüfung
-        print(f"[DEBUG] Zeit-Level vollständig generiert. Plattformen: {len(self.platforms)}")
-        print(f"[DEBUG] Erste Plattform bei ({self.platforms[0].x}, {self.platforms[0].y})")
-        print(f"[DEBUG] Anzahl Portale: {len(self.portals)}")
+        if DEBUG_OUTPUT:
+            print(f"[DEBUG] Zeit-Level vollständig generiert. Plattformen: {len(self.platforms)}")
+            print(f"[DEBUG] Erste Plattform bei ({self.platforms[0].x}, {self.platforms[0].y})")
+            print(f"[DEBUG] Anzahl Portale: {len(self.portals)}")
         
     def _generate_random_level(self, level_number: int) -> None:
         """Generiert ein zufälliges Level basierend auf der Levelnummer für höhere Schwierigkeit."""
@@ -328,7 +354,7 @@ class World:
         try:
             # Sichere Berechnung mit Werten in einer vernünftigen Größenordnung
             safe_camera_delta = float(max(min(camera_delta_x, 100.0), -100.0))
-            safe_parallax = np.clip(parallax_factor, 0.0, 1.0)
+            safe_parallax = clamp_array(parallax_factor, 0.0, 1.0)
             safe_dt = float(max(min(dt, 0.1), 0.0))
             
             # Verwende explizite Typkonvertierung und np.subtract für kontrollierte Berechnung
@@ -509,45 +535,21 @@ class World:
             camera_offset_x = int(self.camera_x)
             camera_offset_y = int(self.camera_y)
             
-            # Plattformen rendern
-            for i, platform in enumerate(self.platforms):
-                try:
-                    # Nur sichtbare Plattformen rendern (Kamera-Culling)
-                    if self._is_visible(platform, camera_offset_x, camera_offset_y):
-                        # Original-Position speichern
-                        original_x, original_y = platform.x, platform.y
-                        
-                        # Position für Kamera anpassen
-                        platform.x -= camera_offset_x
-                        platform.y -= camera_offset_y
-                        
-                        # Rendern mit zusätzlicher Sicherheit für die dritte Plattform im Zeitlevel
-                        try:
-                            platform.render(surface, current_dimension)
-                        except Exception as e:
-                            # Fallback bei Rendering-Fehler
-                            fallback_rect = pygame.Rect(
-                                int(platform.x), 
-                                int(platform.y), 
-                                int(platform.width), 
-                                int(platform.height)
-                            )
-                            pygame.draw.rect(surface, (150, 150, 150), fallback_rect)
-                        
-                        # Position wiederherstellen
-                        platform.x, platform.y = original_x, original_y
-                except Exception:
-                    # Bei Fehler mit einer Plattform nicht das gesamte Rendering abbrechen
-                    continue
+            # Sichtbare Plattformen gesammelt rendern (Kamera-Culling inklusive)
+            try:
+                render_platforms(self.get_platforms(current_dimension), surface, current_dimension,
+                                 camera_offset_x, camera_offset_y)
+            except Exception:
+                # Bei Fehler nicht das gesamte Rendering abbrechen
+                pass
             
             # Sammelobjekte rendern
-            for collectible in self.collectibles:
-                if not collectible.collected and self._is_visible(collectible, camera_offset_x, camera_offset_y):
-                    original_x, original_y = collectible.x, collectible.y
-                    collectible.x -= camera_offset_x
-                    collectible.y -= camera_offset_y
-                    collectible.render(surface, current_dimension)
-                    collectible.x, collectible.y = original_x, original_y
+            try:
+                render_collectibles(self.collectibles, surface, current_dimension,
+                                    camera_offset_x, camera_offset_y)
+            except Exception:
+                # Ein fehlerhafter Durchgang darf die übrigen Objekte nicht verschwinden lassen
+                pass
             
             # Vordergrundpartikel auf separater Oberfläche mit Alpha-Blending rendern
             if self.active_particles > 0:
@@ -600,13 +602,11 @@ class World:
                     pass
             
             # Gegner rendern
-            for enemy in self.enemies:
-                if not enemy.is_dead and self._is_visible(enemy, camera_offset_x, camera_offset_y):
-                    original_x, original_y = enemy.x, enemy.y
-                    enemy.x -= camera_offset_x
-                    enemy.y -= camera_offset_y
-                    enemy.render(surface, current_dimension)
-                    enemy.x, enemy.y = original_x, original_y
+            try:
+                render_enemies(self.enemies, surface, current_dimension, camera_offset_x, camera_offset_y)
+            except Exception:
+                # Ein fehlerhafter Durchgang darf Portal und Powerups nicht verschwinden lassen
+                pass
             
             # Portale rendern
             for portal in self.portals:
@@ -654,14 +654,7 @@ class World:
                 
             if not powerup.collected:
                 # Kollisionsprüfung
-                powerup_rect = pygame.Rect(
-                    powerup.x, 
-                    powerup.y, 
-                    powerup.width, 
-                    powerup.height
-                )
-                
-                if player_rect.colliderect(powerup_rect):
+                if player_rect.colliderect(powerup.get_rect()):
                     powerup.collected = True
                     powerup_collected = True
                     powerup_type = powerup.powerup_type
@@ -672,6 +665,11 @@ class World:
                 
         return powerup_collected, powerup_type
             
+    def remove_dead_enemies(self) -> None:
+        """Entfernt besiegte Gegner, damit Update, Kollision und Rendering sie nicht mehr durchlaufen."""
+        # In-place, damit Referenzen auf die Liste gültig bleiben; die Reihenfolge bleibt erhalten
+        self.enemies[:] = [enemy for enemy in self.enemies if not enemy.is_dead]
+    
     def spawn_powerup(self, x: float, y: float, powerup_type: Optional[str] = None) -> None:
         """Erzeugt ein neues Powerup an der angegebenen Position."""
         if powerup_type is None:
@@ -683,66 +681,46 @@ class World:
         # Powerup erstellen
         self.powerups.append(Powerup(x, y, powerup_type))
         
-    def get_all_objects(self) -> List[Dict[str, Any]]:
-        """Gibt alle Spielobjekte als Liste von Dictionaries für die Minimap zurück."""
-        objects = []
-        
-        # Füge Plattformen hinzu
-        for platform in self.platforms:
-            objects.append({
-                "type": "platform",
-                "x": platform.x,
-                "y": platform.y,
-                "width": platform.width,
-                "height": platform.height
-            })
-        
-        # Füge Portale hinzu
-        for portal in self.portals:
-            objects.append({
-                "type": "portal",
-                "x": portal.x,
-                "y": portal.y,
-                "width": portal.width,
-                "height": portal.height
-            })
-        
-        # Füge Sammelobjekte hinzu
-        for collectible in self.collectibles:
-            if not collectible.collected:
-                objects.append({
-                    "type": "collectible",
-                    "x": collectible.x,
-                    "y": collectible.y,
-                    "width": collectible.width,
-                    "height": collectible.height
-                })
-        
-        # Füge Gegner hinzu
-        for enemy in self.enemies:
-            if not enemy.is_dead:
-                objects.append({
-                    "type": "enemy",
-                    "x": enemy.x,
-                    "y": enemy.y,
-                    "width": enemy.width,
-                    "height": enemy.height
-                })
-                
-        # Füge Powerups hinzu
-        for powerup in self.powerups:
-            if not powerup.collected:
-                objects.append({
-                    "type": "powerup",
-                    "x": powerup.x,
-                    "y": powerup.y,
-                    "width": powerup.width,
-                    "height": powerup.height,
-                    "powerup_type": powerup.powerup_type
-                })
-        
-        return objects 
+    def get_all_objects(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gibt alle sichtbaren Spielobjekte für die Minimap als Structure-of-Arrays zurück:
+        x, y, Breite und Höhe als (N, 4)-Array sowie den Typindex aus MINIMAP_OBJECT_TYPES.
+        """
+        # Reihenfolge entspricht MINIMAP_OBJECT_TYPES (und damit der Zeichenreihenfolge)
+        groups = (
+            self.platforms,
+            self.portals,
+            [collectible for collectible in self.collectibles if not collectible.collected],
+            [enemy for enemy in self.enemies if not enemy.is_dead],
+            [powerup for powerup in self.powerups if not powerup.collected]
+        )
+        
+        boxes = np.array([(obj.x, obj.y, obj.width, obj.height) for group in groups for obj in group],
+                         dtype=np.float32).reshape(-1, 4)
+        kinds = np.repeat(np.arange(len(groups), dtype=np.uint8), [len(group) for group in groups])
+        return boxes, kinds 
 
+    def get_platforms(self, dimension: int) -> List[Platform]:
+        """Liefert die in dimension sichtbaren Plattformen (nur lesend verwenden)."""
+        platforms = self._platforms_by_dimension.get(dimension)
+        if platforms is None:
+            # Sichtbarkeit und Plattformen ändern sich erst mit dem nächsten Level
+            platforms = [platform for platform in self.platforms
+                         if platform.dimension_visible == -1 or platform.dimension_visible == dimension]
+            self._platforms_by_dimension[dimension] = platforms
+        return platforms
+    
+    def get_platform_grid(self, dimension: int) -> SpatialHash:
+        """Liefert das Kollisionsraster der in dimension sichtbaren Plattformen."""
+        grid = self._platform_grids.get(dimension)
+        if grid is None:
+            # Plattformen bewegen sich nicht, das Raster bleibt daher bis zum nächsten Level gültig
+            grid = SpatialHash(PLATFORM_GRID_CELL_SIZE)
+            for platform in self.get_platforms(dimension):
+                grid.insert(platform)
+            self._platform_grids[dimension] = grid
+        return grid
+    
     def _clear_level(self) -> None:
         """Löscht alle vorhandenen Levelobjekte."""
         # Alle vorhandenen Objekte löschen
@@ -751,6 +729,8 @@ class World:
         self.collectibles.clear()
         self.enemies.clear()
         self.powerups.clear()
+        self._platforms_by_dimension.clear()
+        self._platform_grids.clear()
         
         # Aktive Partikel zurücksetzen
         self.active_particles = 0